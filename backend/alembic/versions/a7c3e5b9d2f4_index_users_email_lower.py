@@ -0,0 +1,50 @@
+"""make user emails unique case-insensitively via a lower(email) index
+
+Hand-written (not autogenerated — the shared dev DB carries orphan tables that
+autogenerate would try to drop). Emails were compared byte-for-byte, so
+`Alice@x.io` and `alice@x.io` could register twice and a mixed-case sign-in
+missed the account. Lookups now compare `lower(email)`; this partial unique
+index serves them with a single B-tree probe and is the ON CONFLICT arbiter
+for user creation. It supersedes the plain `users_email_key` constraint and
+`ix_users_email`, which are dropped.
+
+Creating the index fails if the table already holds emails that differ only
+by case; merge those accounts first.
+
+Revision ID: a7c3e5b9d2f4
+Revises: f3a8d2c6b7e1
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a7c3e5b9d2f4"
+down_revision: str | Sequence[str] | None = "f3a8d2c6b7e1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_email_lower",
+        "users",
+        [sa.text("lower(email)")],
+        unique=True,
+        postgresql_where=sa.text("email IS NOT NULL"),
+    )
+    op.drop_index("ix_users_email", table_name="users")
+    op.drop_constraint("users_email_key", "users", type_="unique")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_unique_constraint("users_email_key", "users", ["email"])
+    op.create_index("ix_users_email", "users", ["email"])
+    op.drop_index("ix_users_email_lower", table_name="users")
@@ -0,0 +1,52 @@
+"""cover the oauth_accounts (provider, sub_id) lookup with user_id
+
+Hand-written (not autogenerated — the shared dev DB carries orphan tables that
+autogenerate would try to drop). OAuth sign-in matches (provider, sub_id) and
+reads user_id. The unique constraint's index held only the key columns, so
+every login also fetched the heap row. This unique index INCLUDEs user_id,
+making the lookup index-only, and replaces the constraint. The single-column
+`provider` and `sub_id` indexes are dropped: nothing filters on either alone,
+and the composite covers `provider` as its prefix.
+
+Revision ID: b4d9f1e3a6c8
+Revises: a7c3e5b9d2f4
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b4d9f1e3a6c8"
+down_revision: str | Sequence[str] | None = "a7c3e5b9d2f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_oauth_accounts_provider_sub_id",
+        "oauth_accounts",
+        ["provider", "sub_id"],
+        unique=True,
+        postgresql_include=["user_id"],
+    )
+    op.drop_constraint(
+        "oauth_accounts_provider_sub_id_key", "oauth_accounts", type_="unique"
+    )
+    op.drop_index("ix_oauth_accounts_sub_id", table_name="oauth_accounts")
+    op.drop_index("ix_oauth_accounts_provider", table_name="oauth_accounts")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_oauth_accounts_provider", "oauth_accounts", ["provider"])
+    op.create_index("ix_oauth_accounts_sub_id", "oauth_accounts", ["sub_id"])
+    op.create_unique_constraint(
+        "oauth_accounts_provider_sub_id_key", "oauth_accounts", ["provider", "sub_id"]
+    )
+    op.drop_index("ix_oauth_accounts_provider_sub_id", table_name="oauth_accounts")
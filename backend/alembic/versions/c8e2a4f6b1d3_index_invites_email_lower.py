@@ -0,0 +1,38 @@
+"""match invite emails case-insensitively via a lower(email) index
+
+Hand-written (not autogenerated — the shared dev DB carries orphan tables that
+autogenerate would try to drop). User emails are compared on `lower(email)`
+since `index_users_email_lower`, so sign-up hands invite lookups a
+lower-cased address; an invite stored as `Foo@x.io` no longer matched. Invite
+lookups now compare `lower(email)` too, served by this index, which replaces
+the plain `ix_invites_email`.
+
+Revision ID: c8e2a4f6b1d3
+Revises: b4d9f1e3a6c8
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c8e2a4f6b1d3"
+down_revision: str | Sequence[str] | None = "b4d9f1e3a6c8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index("ix_invites_email_lower", "invites", [sa.text("lower(email)")])
+    op.drop_index("ix_invites_email", table_name="invites")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_invites_email", "invites", ["email"])
+    op.drop_index("ix_invites_email_lower", table_name="invites")
@@ -0,0 +1,40 @@
+"""index threads (user_id, created_at DESC, id) for the thread list
+
+Hand-written (not autogenerated — the shared dev DB carries orphan tables that
+autogenerate would try to drop). `GET /threads/` filters on `user_id` and
+orders by `created_at DESC, id`; with only `ix_threads_user_id` Postgres reads
+every one of the user's threads and sorts them before applying LIMIT. The
+composite matches the ORDER BY column-for-column, so a page is a range scan.
+
+Revision ID: e9c4b7a2d1f6
+Revises: c8f4e2a91d05
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e9c4b7a2d1f6"
+down_revision: str | Sequence[str] | None = "c8f4e2a91d05"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_threads_user_id_created_at",
+        "threads",
+        ["user_id", sa.text("created_at DESC"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_threads_user_id_created_at", table_name="threads")
@@ -0,0 +1,41 @@
+"""index users (role, created_at DESC, id) for the user list
+
+Hand-written (not autogenerated — the shared dev DB carries orphan tables that
+autogenerate would try to drop). `GET /users/` orders by `created_at DESC, id`
+and the admin view filters it by `role`; with only `ix_users_email` Postgres
+scans and sorts the whole table before applying LIMIT. With the role filter
+a page is a range scan of this index; `count_by_role` can be answered from it
+too.
+
+Revision ID: f3a8d2c6b7e1
+Revises: e9c4b7a2d1f6
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f3a8d2c6b7e1"
+down_revision: str | Sequence[str] | None = "e9c4b7a2d1f6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_users_role_created_at",
+        "users",
+        ["role", sa.text("created_at DESC"), "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_users_role_created_at", table_name="users")
@@ -6,11 +6,13 @@ outlives the request. `GET /{run_id}/stream` reattaches to a live or finished ru
 by replaying its event log from a cursor.
 """
 
-from fastapi import APIRouter, Body, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.agents.runs.schemas import RunCreate, RunResponse
+from app.agents.runs.schemas import RunCreate, RunRequest, RunResponse
 from app.agents.runs.service import RunService
 from app.agents.runs.state import RunStatus
 from app.agents.runtime import read_run_result
@@ -40,6 +42,14 @@ _SSE_HEADERS = {
     "X-Accel-Buffering": "no",
 }
 
+# The body is parsed by `parse_run_request`, not FastAPI, so document it here.
+_RUN_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": False,
+        "content": {"application/json": {"schema": RunRequest.model_json_schema()}},
+    }
+}
+
 
 def get_run_service() -> RunService:
     return RunService(get_redis())
@@ -72,6 +82,25 @@ async def authorize_thread(
     return thread
 
 
+async def parse_run_request(request: Request) -> RunRequest:
+    """Validate the run body straight from the raw request bytes.
+
+    This body carries the whole chat turn; `model_validate_json` parses it in
+    pydantic-core instead of decoding to a Python dict and validating that.
+    """
+    try:
+        return RunRequest.model_validate_json(await request.body() or b"{}")
+    except ValidationError as exc:
+        # include_url=False matches the error shape FastAPI's own body
+        # validation returns on every other endpoint.
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ]
+        )
+
+
 def _ensure_run_on_thread(record, thread_id: str) -> None:
     """A run id from another thread must not leak across the nested route."""
     if record.thread_id != thread_id:
@@ -95,12 +124,10 @@ async def list_active_runs(
     return [RunResponse.from_record(r) for r in records]
 
 
-@router.post("/stream")
+@router.post("/stream", openapi_extra=_RUN_REQUEST_OPENAPI)
 async def create_run_stream(
     thread_id: str,
-    agent_input: dict | None = Body(None, embed=True, alias="input"),
-    command: dict | None = Body(None, embed=True),
-    config: dict | None = Body(None, embed=True),
+    body: RunRequest = Depends(parse_run_request),
     thread: ThreadResponse = Depends(authorize_thread),
     runs: RunService = Depends(get_run_service),
     db: AsyncSession = Depends(get_db),  # dependency-cached: same session auth used
@@ -115,29 +142,26 @@ async def create_run_stream(
     # else (RunService opens its own sessions; holding both risks pool
     # starvation) and before the response streams for the whole run.
     await db.commit()
-    trigger, config_overrides = _parse_run_config(config)
+    trigger, config_overrides = _parse_run_config(body.config)
     record = await runs.create(
         thread_id=thread_id,
         user_id=str(thread.user_id),
-        input=agent_input,
-        command=command,
+        input=body.input,
+        command=body.command,
         trigger=trigger,
         config_overrides=config_overrides,
     )
     return StreamingResponse(
-        runs.stream(record.id),
+        runs.stream_bytes(record.id),
         media_type="text/event-stream",
         headers={**_SSE_HEADERS, "X-Run-Id": record.id},
     )
 
 
-@router.post("/invoke")
+@router.post("/invoke", openapi_extra=_RUN_REQUEST_OPENAPI)
 async def invoke_run(
     thread_id: str,
-    agent_input: dict | None = Body(None, embed=True, alias="input"),
-    command: dict | None = Body(None, embed=True),
-    config: dict | None = Body(None, embed=True),
-    output_schema: dict | None = Body(None, embed=True),
+    body: RunRequest = Depends(parse_run_request),
     thread: ThreadResponse = Depends(authorize_thread),
     runs: RunService = Depends(get_run_service),
     db: AsyncSession = Depends(get_db),  # dependency-cached: same session auth used
@@ -157,15 +181,15 @@ async def invoke_run(
     # else (RunService opens its own sessions; holding both risks pool
     # starvation) and before blocking for the whole run.
     await db.commit()
-    trigger, config_overrides = _parse_run_config(config)
+    trigger, config_overrides = _parse_run_config(body.config)
     record = await runs.create(
         thread_id=thread_id,
         user_id=str(thread.user_id),
-        input=agent_input,
-        command=command,
+        input=body.input,
+        command=body.command,
         trigger=trigger,
         config_overrides=config_overrides,
-        output_schema=output_schema,
+        output_schema=body.output_schema,
     )
     record = await runs.wait_for_terminal(record.id)
     # Only a clean success yields a result. cancelled/interrupted/error/timeout
@@ -177,9 +201,9 @@ async def invoke_run(
     result = await read_run_result(thread_id)
     # Backstop for paths where the formatting turn never ran (e.g. recursion
     # fallback): the schema contract must hold on everything returned here.
-    if output_schema is not None and (
+    if body.output_schema is not None and (
         error := validate_structured_response(
-            result["structured_response"], output_schema
+            result["structured_response"], body.output_schema
         )
     ):
         raise StructuredOutputError(
@@ -269,7 +293,7 @@ async def stream_run(
     record = await runs.get(run_id)
     _ensure_run_on_thread(record, thread_id)
     return StreamingResponse(
-        runs.stream(run_id, last_event_id),
+        runs.stream_bytes(run_id, last_event_id),
         media_type="text/event-stream",
         headers={**_SSE_HEADERS, "X-Run-Id": run_id},
     )
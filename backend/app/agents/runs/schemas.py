@@ -20,6 +20,19 @@ class RunCreate(BaseModel):
     multitask_strategy: Literal["reject", "enqueue"] = "reject"
 
 
+class RunRequest(BaseModel):
+    """Client payload for `POST /stream` and `POST /invoke`.
+
+    Same `input` / `command` / `config` as `RunCreate`; `output_schema` (invoke
+    only) asks for a validated `structured_response` in the result.
+    """
+
+    input: dict | None = None
+    command: dict | None = None
+    config: dict | None = None
+    output_schema: dict | None = None
+
+
 class RunResponse(BaseModel):
     """API projection of a run — operational state only (no input/command)."""
 
@@ -5,6 +5,7 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
+from app.agents.core.repository import AgentRepository
 from app.agents.models import AgentDB, AgentSubagentDB
 from app.agents.schemas import SubagentResponse
 from app.agents.subagents.repository import SubagentRepository
@@ -82,9 +83,6 @@ class SubagentService:
         if supervisor_id == subagent_id:
             raise DomainValidationError("Cannot add an agent as its own subagent")
 
-        # Local import avoids AgentService → SubagentService circular import.
-        from app.agents.core.repository import AgentRepository
-
         agent_repo = AgentRepository(self.db)
 
         supervisor = await agent_repo.get(supervisor_id)
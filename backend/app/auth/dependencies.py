@@ -4,7 +4,6 @@ from uuid import UUID
 
 from fastapi import Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
 
 from app.auth.settings import auth_settings
 from app.auth.tokens.repository import PersonalAccessTokenRepository
@@ -22,8 +21,7 @@ ROLE_HIERARCHY: dict[WorkspaceRole, int] = {
 
 
 async def _resolve_user_by_id(db: AsyncSession, user_id: UUID) -> UserDB | None:
-    result = await db.execute(select(UserDB).where(UserDB.id == user_id))
-    return result.scalar_one_or_none()
+    return await db.get(UserDB, user_id)
 
 
 def _extract_bearer_token(request: Request) -> str | None:
@@ -43,13 +43,15 @@ class AuthService:
         return user, create_access_token(user.id)
 
     async def _ensure_email_available(self, email: str) -> None:
-        result = await self.db.execute(select(UserDB).where(UserDB.email == email))
+        stmt = select(UserDB).where(func.lower(UserDB.email) == email.lower())
+        result = await self.db.execute(stmt)
         if result.scalar_one_or_none() is not None:
             raise AlreadyExistsError("Email already registered")
 
     async def signin(self, data: SigninRequest) -> tuple[UserDB, str]:
         self._ensure_password_auth()
-        result = await self.db.execute(select(UserDB).where(UserDB.email == data.email))
+        stmt = select(UserDB).where(func.lower(UserDB.email) == data.email.lower())
+        result = await self.db.execute(stmt)
         user = result.scalar_one_or_none()
         if user is None or user.password_hash is None:
             raise InvalidCredentialsError("Invalid email or password")
@@ -68,7 +70,6 @@ class AuthService:
         )
         self.db.add(user)
         await self.db.flush()
-        await self.db.refresh(user)
         return self.build_jwt_for_user(user)
 
     async def accept_invite(self, data: InviteAcceptRequest) -> tuple[UserDB, str]:
@@ -89,7 +90,6 @@ class AuthService:
         invite.status = InviteStatus.accepted
         self.db.add(invite)
         await self.db.flush()
-        await self.db.refresh(user)
         return self.build_jwt_for_user(user)
 
     async def google_signin_or_link(
@@ -108,24 +108,22 @@ class AuthService:
         Raises :class:`NoInviteError` when a new user has no invite — the
         router converts this to a redirect with an error param.
         """
-        result = await self.db.execute(
-            select(OAuthAccountDB).where(
-                OAuthAccountDB.provider == "google",
-                OAuthAccountDB.sub_id == google_sub,
-            )
+        # Only user_id is read, so the covering (provider, sub_id) index
+        # answers this without touching the table.
+        stmt = select(OAuthAccountDB.user_id).where(
+            OAuthAccountDB.provider == "google",
+            OAuthAccountDB.sub_id == google_sub,
         )
-        oauth_account = result.scalar_one_or_none()
+        linked_user_id = await self.db.scalar(stmt)
 
-        if oauth_account:
-            result = await self.db.execute(
-                select(UserDB).where(UserDB.id == oauth_account.user_id)
-            )
-            user = result.scalar_one_or_none()
+        if linked_user_id is not None:
+            user = await self.db.get(UserDB, linked_user_id)
             if not user:
                 raise DomainError("Linked user not found")
             return self.build_jwt_for_user(user)
 
-        result = await self.db.execute(select(UserDB).where(UserDB.email == email))
+        stmt = select(UserDB).where(func.lower(UserDB.email) == email.lower())
+        result = await self.db.execute(stmt)
         user = result.scalar_one_or_none()
 
         if user:
@@ -166,7 +164,6 @@ class AuthService:
         invite.status = InviteStatus.accepted
         self.db.add(invite)
         await self.db.flush()
-        await self.db.refresh(user)
         return self.build_jwt_for_user(user)
 
 
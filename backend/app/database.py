@@ -1,7 +1,7 @@
 import asyncio
+import logging
 from contextlib import asynccontextmanager
 
-from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
 from psycopg.rows import dict_row
 from psycopg_pool import AsyncConnectionPool
 from sqlalchemy import make_url
@@ -11,8 +11,12 @@ from sqlalchemy.orm import sessionmaker
 from app.settings import app_settings
 
 
+logger = logging.getLogger(__name__)
+
 engine = create_async_engine(
     app_settings.database_url,
+    pool_size=app_settings.database_pool_size,
+    max_overflow=app_settings.database_max_overflow,
     pool_pre_ping=True,
     future=True,
 )
@@ -36,6 +40,48 @@ async def get_db() -> AsyncSession:
             await session.commit()
 
 
+async def warm_engine_pool() -> None:
+    """Fill the engine's pool up front (app startup), so the first requests
+    after a deploy don't each pay for TCP + TLS + auth. The connections are
+    opened concurrently and held until all are up, so the pool ends with
+    `pool_size` distinct idle connections. Best-effort: a database that is
+    not reachable yet must not block startup; requests connect lazily."""
+    size = engine.pool.size()
+    remaining = size
+    all_attempted = asyncio.Event()
+
+    def attempted() -> None:
+        nonlocal remaining
+        remaining -= 1
+        if not remaining:
+            all_attempted.set()
+
+    async def open_and_hold() -> None:
+        conn = engine.connect()
+        try:
+            await conn.start()
+        finally:
+            attempted()
+        # Closed even when shutdown cancels the warm-up mid-wait, so the
+        # connections already opened go back to the pool instead of leaking.
+        try:
+            await all_attempted.wait()
+        finally:
+            await conn.close()
+
+    results = await asyncio.gather(
+        *(open_and_hold() for _ in range(size)), return_exceptions=True
+    )
+    failures = [r for r in results if isinstance(r, BaseException)]
+    if failures:
+        logger.warning(
+            "Could not pre-open %d of %d database connections",
+            len(failures),
+            size,
+            exc_info=failures[0],
+        )
+
+
 def get_psycopg_conn_string(sqlalchemy_url=None) -> str:
     """Convert a SQLAlchemy database URL to a psycopg-compatible connection string.
 
@@ -87,6 +133,13 @@ async def _get_checkpointer_pool() -> AsyncConnectionPool:
     return _checkpointer_pool
 
 
+async def open_checkpointer_pool() -> None:
+    """Open the checkpointer pool up front (app startup), so the first run or
+    thread read doesn't pay for pool setup. `open()` doesn't block on Postgres
+    being reachable; connections are filled in the background."""
+    await _get_checkpointer_pool()
+
+
 async def close_checkpointer_pool() -> None:
     """Release the checkpointer pool's connections (app shutdown)."""
     global _checkpointer_pool
@@ -98,5 +151,16 @@ async def close_checkpointer_pool() -> None:
 
 @asynccontextmanager
 async def get_checkpointer():
+    """Yield a saver over the shared pool.
+
+    The saver itself is deliberately per-scope, not a process singleton: it
+    holds every cursor under its own `asyncio.Lock`, so one shared instance
+    would serialize all checkpoint IO behind a single lock and waste the pool.
+    Construction is cheap; the expensive part (connections) is pooled.
+    """
+    # Deferred: most importers of this module (scripts, workers) only need
+    # `engine`, and shouldn't pay for importing langgraph.
+    from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+
     pool = await _get_checkpointer_pool()
     yield AsyncPostgresSaver(pool)
@@ -2,6 +2,7 @@ from datetime import datetime
 from enum import Enum
 from uuid import UUID
 
+from sqlalchemy import Index, text
 from sqlmodel import Column, DateTime, Field, SQLModel
 
 from app.models import BaseDBModel
@@ -24,8 +25,12 @@ class InviteCreateDB(SQLModel):
 
 class InviteDB(BaseDBModel, table=True):
     __tablename__ = "invites"
+    # Mirrors the `index_invites_email_lower` migration: invite lookups match
+    # emails case-insensitively, like users, so they compare
+    # `func.lower(InviteDB.email)` against a lower-cased value.
+    __table_args__ = (Index("ix_invites_email_lower", text("lower(email)")),)
 
-    email: str = Field(max_length=255, index=True)
+    email: str = Field(max_length=255)
     role: str = Field(default="member", nullable=False)
     token: str = Field(unique=True, index=True)
     status: InviteStatus = Field(default=InviteStatus.pending, nullable=False)
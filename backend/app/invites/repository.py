@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlmodel import func, select
 
 from app.invites.models import InviteDB, InviteStatus
 from app.repository import BaseRepository
@@ -16,7 +16,7 @@ class InviteRepository(BaseRepository[InviteDB]):
 
     async def get_pending_by_email(self, email: str) -> InviteDB | None:
         stmt = select(InviteDB).where(
-            InviteDB.email == email,
+            func.lower(InviteDB.email) == email.lower(),
             InviteDB.status == InviteStatus.pending,
         )
         result = await self.db.execute(stmt)
@@ -30,7 +30,7 @@ class InviteRepository(BaseRepository[InviteDB]):
     async def revoke_pending_by_email(self, email: str) -> None:
         """Set all pending invites for the given email to revoked (no commit)."""
         stmt = select(InviteDB).where(
-            InviteDB.email == email,
+            func.lower(InviteDB.email) == email.lower(),
             InviteDB.status == InviteStatus.pending,
         )
         result = await self.db.execute(stmt)
@@ -4,7 +4,7 @@ from uuid import UUID
 
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlmodel import select
+from sqlmodel import func, select
 
 from app.auth.settings import auth_settings
 from app.database import get_db
@@ -61,7 +61,8 @@ class InviteService(BaseService[InviteDB, InviteRepository]):
         team_id: UUID | None = None,
     ) -> InviteDB:
         """Create a new invite, revoking any existing pending invite for the same email."""
-        result = await self.db.execute(select(UserDB).where(UserDB.email == email))
+        stmt = select(UserDB).where(func.lower(UserDB.email) == email.lower())
+        result = await self.db.execute(stmt)
         if result.scalar_one_or_none():
             raise AlreadyExistsError("Email already registered")
         if team_id is not None and not await TeamRepository(self.db).get(team_id):
@@ -16,7 +16,11 @@ from app.agents.runs.worker import RunDispatcher
 from app.auth.router import router as auth_router
 from app.auth.settings import auth_settings
 from app.auth.tokens.router import router as tokens_router
-from app.database import close_checkpointer_pool
+from app.database import (
+    close_checkpointer_pool,
+    open_checkpointer_pool,
+    warm_engine_pool,
+)
 from app.exceptions import (
     AlreadyExistsError,
     DomainError,
@@ -64,6 +68,7 @@ def _log_background_crash(task: asyncio.Task) -> None:
 async def lifespan(app: FastAPI):
     apply_mcp_client_patches()
     app.state.redis = get_redis()
+    await open_checkpointer_pool()
 
     # The dispatcher + reaper are background loops; they need an always-on
     # instance with CPU allocated (Cloud Run: --no-cpu-throttling, min-instances>=1).
@@ -88,6 +93,9 @@ async def lifespan(app: FastAPI):
             )
         for task in background:
             task.add_done_callback(_log_background_crash)
+    # Not awaited: an unreachable database would otherwise hold up startup
+    # for a full connect timeout. Cancelled with the loops on shutdown.
+    background.append(asyncio.create_task(warm_engine_pool(), name="db-pool-warmup"))
 
     async with auxilia_mcp.session_manager.run():
         try:
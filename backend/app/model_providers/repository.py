@@ -1,3 +1,5 @@
+from collections.abc import Sequence
+
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import select
 
@@ -9,10 +11,12 @@ class ModelRepository(BaseRepository[ModelDB]):
     def __init__(self, db: AsyncSession):
         super().__init__(ModelDB, db)
 
-    async def list_all(self) -> list[ModelDB]:
+    async def list_all(self) -> Sequence[ModelDB]:
+        # Read on every model-availability check; callers only iterate, so
+        # hand back the result's own list rather than copying it.
         stmt = select(ModelDB)
         result = await self.db.execute(stmt)
-        return list(result.scalars().all())
+        return result.scalars().all()
 
     async def get_by_provider_and_model_id(
         self, provider: str, model_id: str, *, for_update: bool = False
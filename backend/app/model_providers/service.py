@@ -8,6 +8,8 @@ create/update, the picker endpoint, and the thread response's
 `model_available` flag.
 """
 
+import asyncio
+
 from fastapi import Depends
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -73,9 +75,10 @@ class ModelService(BaseService[ModelDB, ModelRepository]):
 
     async def list_available(self) -> list[SupportedModel]:
         """The models users may pick: whitelist ∧ provider key ∧ admin-enabled."""
-        whitelist = await get_whitelist()
+        # The whitelist may come from Redis or the CDN; the enablement rows
+        # from Postgres. Neither depends on the other, so overlap them.
+        whitelist, enabled = await asyncio.gather(get_whitelist(), self._enabled_keys())
         keys = provider_api_keys()
-        enabled = await self._enabled_keys()
         return [
             m
             for m in whitelist
@@ -130,9 +133,11 @@ class ModelService(BaseService[ModelDB, ModelRepository]):
         """The admin view: every whitelist model whose provider has a key,
         with its enablement state, plus orphan rows whose model has left the
         whitelist (flagged deprecated so admins understand blocked threads)."""
-        whitelist = await get_whitelist()
+        whitelist, all_rows = await asyncio.gather(
+            get_whitelist(), self.repository.list_all()
+        )
         keys = provider_api_keys()
-        rows = {(r.provider, r.model_id): r for r in await self.repository.list_all()}
+        rows = {(r.provider, r.model_id): r for r in all_rows}
 
         managed = [
             ManagedModelResponse(
@@ -26,7 +26,9 @@ class ModelProviderSettings(BaseSettings):
         "https://pub-7a6e8912b3c448b8a8bfa47a0363f7bc.r2.dev/models/whitelist.yaml"
     )
 
-    model_config: ConfigDict = ConfigDict(env_file=ROOT_ENV, extra="ignore")
+    model_config: ConfigDict = ConfigDict(
+        env_file=ROOT_ENV, extra="ignore", frozen=True
+    )
 
 
 model_provider_settings = ModelProviderSettings()
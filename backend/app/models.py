@@ -1,8 +1,10 @@
+import os
+import time
 from datetime import datetime
-from typing import Annotated, Any
-from uuid import UUID, uuid4
+from typing import Annotated, Any, Literal
+from uuid import UUID
 
-from pydantic import BaseModel, Discriminator, Tag
+from pydantic import BaseModel, BeforeValidator, Discriminator
 from sqlalchemy import DateTime
 from sqlalchemy.sql import func
 from sqlmodel import Field, SQLModel
@@ -13,10 +15,23 @@ from sqlmodel import Field, SQLModel
 # ---------------------------------------------------------------------------
 
 
+def uuid7() -> UUID:
+    """Time-ordered UUID (RFC 9562 version 7): 48-bit Unix ms timestamp, then
+    random bits.
+
+    New ids sort after existing ones, so primary-key inserts append to the
+    right edge of the B-tree instead of landing on random pages as uuid4 does.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC variant
+    return UUID(int=value)
+
+
 class UUIDMixin(SQLModel):
     """UUID primary key. Skip this for composite-key join tables."""
 
-    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    id: UUID = Field(default_factory=uuid7, primary_key=True)
 
 
 class TimestampMixin(SQLModel):
@@ -49,18 +64,27 @@ class BaseDBModel(UUIDMixin, TimestampMixin, SQLModel):
 # ---------------------------------------------------------------------------
 
 
+# Each part carries a ``kind`` tag so ``MessagePart`` is a plain tagged union:
+# pydantic-core dispatches on the tag with a dict lookup instead of calling
+# back into Python for every part. ``kind`` is internal — excluded from dumps,
+# so the wire format stays the AI SDK's ``type``-only shape.
+
+
 class TextMessagePart(BaseModel):
-    type: str = "text"
+    kind: Literal["text"] = Field(default="text", exclude=True)
+    type: Literal["text"] = "text"
     text: str
 
 
 class ReasoningMessagePart(BaseModel):
-    type: str = "reasoning"
+    kind: Literal["reasoning"] = Field(default="reasoning", exclude=True)
+    type: Literal["reasoning"] = "reasoning"
     text: str
 
 
 class ToolMessagePart(BaseModel):
-    type: str
+    kind: Literal["tool"] = Field(default="tool", exclude=True)
+    type: str  # dynamic ``tool-<name>``
     toolCallId: str
     toolName: str | None = None
     state: str
@@ -72,30 +96,31 @@ class ToolMessagePart(BaseModel):
 
 
 class FileMessagePart(BaseModel):
-    type: str = "file"
+    kind: Literal["file"] = Field(default="file", exclude=True)
+    type: Literal["file"] = "file"
     filename: str | None = None
     mediaType: str | None = None
     url: str | None = None
 
 
-def get_message_part_type(value: Any) -> str:
-    """Custom discriminator that handles dynamic tool-* types."""
-    if isinstance(value, dict):
-        type_val = value.get("type", "")
-    else:
-        type_val = getattr(value, "type", "")
+def _tag_message_part(value: Any) -> Any:
+    """Derive ``kind`` for raw AI SDK dicts, which only carry ``type``.
 
-    if isinstance(type_val, str) and type_val.startswith("tool-"):
-        return "tool"
-    return type_val
+    Dynamic ``tool-*`` types collapse to ``"tool"``. Part instances already
+    carry their tag and pass through untouched.
+    """
+    if isinstance(value, dict) and "kind" not in value:
+        type_val = value.get("type", "")
+        if isinstance(type_val, str) and type_val.startswith("tool-"):
+            type_val = "tool"
+        return {**value, "kind": type_val}
+    return value
 
 
 MessagePart = Annotated[
-    Annotated[TextMessagePart, Tag("text")]
-    | Annotated[ReasoningMessagePart, Tag("reasoning")]
-    | Annotated[ToolMessagePart, Tag("tool")]
-    | Annotated[FileMessagePart, Tag("file")],
-    Discriminator(get_message_part_type),
+    TextMessagePart | ReasoningMessagePart | ToolMessagePart | FileMessagePart,
+    Discriminator("kind"),
+    BeforeValidator(_tag_message_part),
 ]
 
 
@@ -1,7 +1,7 @@
 from enum import Enum
 from uuid import UUID, uuid4
 
-from sqlalchemy import Enum as SAEnum
+from sqlalchemy import Enum as SAEnum, Index, text
 from sqlmodel import Column, Field, SQLModel, String, Text
 
 # `state` is a leaf module (stdlib-only), so this cannot cycle even though
@@ -42,6 +42,17 @@ class ThreadBase(SQLModel):
 
 class ThreadDB(ThreadBase, TimestampMixin, table=True):
     __tablename__ = "threads"
+    # Mirrors the `index_threads_user_id_created_at` migration. Matches the
+    # sidebar list's `WHERE user_id = … ORDER BY created_at DESC, id` exactly,
+    # so a page is a short index range scan with no sort step.
+    __table_args__ = (
+        Index(
+            "ix_threads_user_id_created_at",
+            "user_id",
+            text("created_at DESC"),
+            "id",
+        ),
+    )
 
     id: str = Field(
         default_factory=lambda: str(uuid4()),
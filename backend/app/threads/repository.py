@@ -13,50 +13,47 @@ from app.threads.models import FIRST_PARTY_SOURCES, ThreadDB
 from app.users.models import UserDB
 
 
+# Thread rows with the agent display fields every thread view needs. Built
+# once: each query only appends its own filters and ordering.
+_THREADS_WITH_AGENT = select(
+    ThreadDB,
+    AgentDB.name,
+    AgentDB.emoji,
+    AgentDB.color,
+    AgentDB.is_archived,
+).join(AgentDB, ThreadDB.agent_id == AgentDB.id)
+
+
 class ThreadRepository(BaseRepository[ThreadDB]):
     def __init__(self, db: AsyncSession):
         super().__init__(ThreadDB, db)
 
     async def get(self, id: str) -> ThreadDB | None:
-        stmt = select(ThreadDB).where(ThreadDB.id == id)
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        # Identity-map aware: a thread already loaded in this session (e.g. by
+        # an ownership check earlier in the request) is returned without SQL.
+        return await self.db.get(ThreadDB, id)
 
     async def list_ids_for_agent(self, agent_id: UUID) -> list[str]:
         stmt = select(ThreadDB.id).where(ThreadDB.agent_id == agent_id)
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
 
+    async def delete_by_id(self, thread_id: str) -> None:
+        stmt = delete(ThreadDB).where(ThreadDB.id == thread_id)
+        await self.db.execute(stmt)
+
     async def delete_for_agent(self, agent_id: UUID) -> None:
         stmt = delete(ThreadDB).where(ThreadDB.agent_id == agent_id)
         await self.db.execute(stmt)
 
     async def get_with_agent(self, thread_id: str):
-        stmt = (
-            select(
-                ThreadDB,
-                AgentDB.name,
-                AgentDB.emoji,
-                AgentDB.color,
-                AgentDB.is_archived,
-            )
-            .join(AgentDB, ThreadDB.agent_id == AgentDB.id)
-            .where(ThreadDB.id == thread_id)
-        )
+        stmt = _THREADS_WITH_AGENT.where(ThreadDB.id == thread_id)
         result = await self.db.execute(stmt)
         return result.one_or_none()
 
     async def list_for_user(self, user_id: UUID, page: PageParams):
         stmt = (
-            select(
-                ThreadDB,
-                AgentDB.name,
-                AgentDB.emoji,
-                AgentDB.color,
-                AgentDB.is_archived,
-            )
-            .join(AgentDB, ThreadDB.agent_id == AgentDB.id)
-            .where(ThreadDB.user_id == user_id)
+            _THREADS_WITH_AGENT.where(ThreadDB.user_id == user_id)
             .where(ThreadDB.source.in_(FIRST_PARTY_SOURCES))
             .order_by(ThreadDB.created_at.desc(), ThreadDB.id)
         )
@@ -88,16 +85,7 @@ class ThreadRepository(BaseRepository[ThreadDB]):
 
     async def list_for_agent(self, agent_id: UUID, page: PageParams):
         stmt = (
-            select(
-                ThreadDB,
-                AgentDB.name,
-                AgentDB.emoji,
-                AgentDB.color,
-                AgentDB.is_archived,
-                UserDB.email,
-                UserDB.name,
-            )
-            .join(AgentDB, ThreadDB.agent_id == AgentDB.id)
+            _THREADS_WITH_AGENT.add_columns(UserDB.email, UserDB.name)
             .join(UserDB, ThreadDB.user_id == UserDB.id)
             .where(ThreadDB.agent_id == agent_id)
             .order_by(ThreadDB.created_at.desc(), ThreadDB.id)
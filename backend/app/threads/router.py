@@ -18,7 +18,7 @@ router = APIRouter(prefix="/threads", tags=["threads"])
 
 
 async def _resolve_viewer_role(
-    thread: ThreadDB,
+    thread: ThreadDB | ThreadResponse,
     current_user: UserDB,
     agent_service: AgentService,
 ) -> ViewerRole | None:
@@ -38,6 +38,13 @@ async def _resolve_viewer_role(
     raise PermissionDeniedError("Not authorized to view this thread")
 
 
+async def _read_checkpoint(thread_id: str):
+    async with get_checkpointer() as checkpointer:
+        return await checkpointer.aget_tuple(
+            config={"configurable": {"thread_id": thread_id}}
+        )
+
+
 @router.get("/{thread_id}")
 async def read_thread(
     thread_id: str,
@@ -45,53 +52,50 @@ async def read_thread(
     service: ThreadService = Depends(get_thread_service),
     agent_service: AgentService = Depends(get_agent_service),
 ) -> dict:
-    thread = await service.get(thread_id)
-    viewer_role = await _resolve_viewer_role(thread, current_user, agent_service)
+    # Access is resolved before the checkpoint is touched, so an unknown or
+    # foreign thread id never loads graph state.
     thread_read = await service.get_with_agent(thread_id)
+    viewer_role = await _resolve_viewer_role(thread_read, current_user, agent_service)
+    checkpoint_tuple = await _read_checkpoint(thread_id)
 
-    async with get_checkpointer() as checkpointer:
-        checkpoint_tuple = await checkpointer.aget_tuple(
-            config={"configurable": {"thread_id": thread_id}}
-        )
-
-        if checkpoint_tuple is None:
-            return {
-                "messages": [],
-                "values": {"messages": []},
-                "thread": thread_read,
-                "interrupted": False,
-                "viewer_role": viewer_role,
-            }
-
-        channel_values = checkpoint_tuple.checkpoint["channel_values"]
-        # Formatting-turn artifacts (raw-JSON message or synthetic tool-call
-        # pair) are chat-history noise: the parsed object is exposed under
-        # values["structured_response"] instead.
-        lc_messages = [
-            m
-            for m in channel_values.get("messages", [])
-            if not is_structured_output_artifact(m)
-        ]
-        todos = channel_values.get("todos", [])
-        values: dict = {
-            "messages": [_serialize_lc_message(m) for m in lc_messages],
-        }
-        if todos:
-            values["todos"] = todos
-        if (structured := channel_values.get("structured_response")) is not None:
-            values["structured_response"] = structured
-
-        interrupt_value = pending_interrupt(checkpoint_tuple)
-
+    if checkpoint_tuple is None:
         return {
-            "messages": deserialize_to_ui_messages(lc_messages),
-            "values": values,
+            "messages": [],
+            "values": {"messages": []},
             "thread": thread_read,
-            "interrupted": interrupt_value is not None,
-            "interrupt_value": interrupt_value,
+            "interrupted": False,
             "viewer_role": viewer_role,
         }
 
+    channel_values = checkpoint_tuple.checkpoint["channel_values"]
+    # Formatting-turn artifacts (raw-JSON message or synthetic tool-call
+    # pair) are chat-history noise: the parsed object is exposed under
+    # values["structured_response"] instead.
+    lc_messages = [
+        m
+        for m in channel_values.get("messages", [])
+        if not is_structured_output_artifact(m)
+    ]
+    todos = channel_values.get("todos", [])
+    values: dict = {
+        "messages": [_serialize_lc_message(m) for m in lc_messages],
+    }
+    if todos:
+        values["todos"] = todos
+    if (structured := channel_values.get("structured_response")) is not None:
+        values["structured_response"] = structured
+
+    interrupt_value = pending_interrupt(checkpoint_tuple)
+
+    return {
+        "messages": deserialize_to_ui_messages(lc_messages),
+        "values": values,
+        "thread": thread_read,
+        "interrupted": interrupt_value is not None,
+        "interrupt_value": interrupt_value,
+        "viewer_role": viewer_role,
+    }
+
 
 def _task_description(messages: list, tool_call_id: str) -> str | None:
     """Return the ``description`` arg of the ``task`` tool call with this id.
@@ -220,7 +224,4 @@ async def delete_thread(
     thread = await service.get(thread_id)
     if thread.user_id != current_user.id:
         raise PermissionDeniedError("Not authorized to delete this thread")
-    async with get_checkpointer() as checkpointer:
-        await checkpointer.adelete_thread(thread_id=thread_id)
-
     await service.delete(thread_id)
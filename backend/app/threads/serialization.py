@@ -5,14 +5,13 @@ from typing import Any
 
 from langchain_ai_sdk_adapter import to_ui_messages
 from langchain_core.messages import BaseMessage, ToolMessage
+from pydantic import TypeAdapter
 
-from app.models import (
-    FileMessagePart,
-    Message,
-    ReasoningMessagePart,
-    TextMessagePart,
-    ToolMessagePart,
-)
+from app.models import Message
+
+
+# Built once at import: the tagged-union validator for a whole message list.
+_UI_MESSAGES = TypeAdapter(list[Message])
 
 
 def _build_tool_metadata_map(
@@ -39,62 +38,51 @@ def _build_tool_metadata_map(
 
 def _convert_part(
     part: dict[str, Any], tool_metadata: dict[str, dict[str, Any]]
-) -> TextMessagePart | ReasoningMessagePart | FileMessagePart | ToolMessagePart | None:
-    """Convert a library UI part dict to an auxilia MessagePart."""
+) -> dict[str, Any] | None:
+    """Convert a library UI part dict to raw auxilia MessagePart data.
+
+    Parts stay plain dicts so the whole message list is validated in a single
+    ``_UI_MESSAGES.validate_python`` pass rather than one model call per part.
+    """
     ptype = part.get("type", "")
 
     if ptype == "text":
-        return TextMessagePart(text=part.get("text", ""))
+        return {"type": "text", "text": part.get("text", "")}
 
     if ptype == "reasoning":
-        return ReasoningMessagePart(text=part.get("text", ""))
+        return {"type": "reasoning", "text": part.get("text", "")}
 
     if ptype == "file":
-        return FileMessagePart(
-            url=part.get("url", ""),
-            filename=part.get("filename"),
-            mediaType=part.get("mediaType"),
-        )
+        return {
+            "type": "file",
+            "url": part.get("url", ""),
+            "filename": part.get("filename"),
+            "mediaType": part.get("mediaType"),
+        }
 
     if ptype == "tool-invocation":
         tc_id = part.get("toolInvocationId", "")
         tc_name = part.get("toolName", "")
         state = part.get("state", "call")
+        tool_part = {
+            "type": f"tool-{tc_name}",
+            "toolCallId": tc_id,
+            "toolName": tc_name,
+            "state": "output-error",
+            "input": part.get("args"),
+            "callProviderMetadata": tool_metadata.get(tc_id),
+        }
 
         if state == "result":
-            return ToolMessagePart(
-                type=f"tool-{tc_name}",
-                toolCallId=tc_id,
-                toolName=tc_name,
-                state="output-available",
-                input=part.get("args"),
-                output=part.get("result"),
-                callProviderMetadata=tool_metadata.get(tc_id),
-            )
-
-        if state == "error":
+            tool_part["state"] = "output-available"
+            tool_part["output"] = part.get("result")
+        elif state == "error":
             error_text = part.get("error", "Tool execution failed")
             if "rejected" in error_text.lower() or "denied" in error_text.lower():
                 error_text = "Tool execution was rejected by user"
-            return ToolMessagePart(
-                type=f"tool-{tc_name}",
-                toolCallId=tc_id,
-                toolName=tc_name,
-                state="output-error",
-                input=part.get("args"),
-                errorText=error_text,
-                callProviderMetadata=tool_metadata.get(tc_id),
-            )
-
-        # state == "call" (no result yet)
-        return ToolMessagePart(
-            type=f"tool-{tc_name}",
-            toolCallId=tc_id,
-            toolName=tc_name,
-            state="output-error",
-            input=part.get("args"),
-            callProviderMetadata=tool_metadata.get(tc_id),
-        )
+            tool_part["errorText"] = error_text
+        # state == "call" (no result yet) keeps the output-error default.
+        return tool_part
 
     return None
 
@@ -209,7 +197,7 @@ def deserialize_to_ui_messages(langgraph_messages: list) -> list[Message]:
                 parts.append(converted)
         if parts:
             messages.append(
-                Message(id=str(uuid.uuid4()), role=msg_dict["role"], parts=parts)
+                {"id": str(uuid.uuid4()), "role": msg_dict["role"], "parts": parts}
             )
 
-    return messages
+    return _UI_MESSAGES.validate_python(messages)
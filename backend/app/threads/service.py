@@ -130,10 +130,15 @@ class ThreadService(BaseService[ThreadDB, ThreadRepository]):
         await self.repository.update(thread, data)
         return await self.get_with_agent(thread_id)
 
-    async def delete(self, thread_id: str) -> ThreadDB:
-        thread = await self.get_or_404(thread_id)
-        await self.db.delete(thread)
-        return thread
+    async def delete(self, thread_id: str) -> None:
+        """Delete a thread row and its LangGraph checkpoints.
+
+        Callers load the thread first (404 / ownership), so the row goes in a
+        single DELETE instead of a second lookup plus an ORM delete. The
+        checkpoints are purged only once that DELETE has succeeded — see
+        ``purge_checkpoints``."""
+        await self.repository.delete_by_id(thread_id)
+        await self.purge_checkpoints([thread_id])
 
     async def delete_rows_for_agent(self, agent_id: UUID) -> list[str]:
         """Bulk-delete an agent's thread rows (one statement) and return their
@@ -1,7 +1,8 @@
 from enum import Enum
 from uuid import UUID
 
-from sqlmodel import Field, Relationship, SQLModel, UniqueConstraint
+from sqlalchemy import Index, text
+from sqlmodel import Field, Relationship, SQLModel
 
 from app.models import BaseDBModel
 
@@ -14,13 +15,29 @@ class WorkspaceRole(str, Enum):
 
 class UserBase(SQLModel):
     name: str | None = Field(default=None, max_length=255)
-    email: str | None = Field(default=None, max_length=255, unique=True, index=True)
+    email: str | None = Field(default=None, max_length=255)
     password_hash: str | None = Field(default=None)
     role: WorkspaceRole = Field(default=WorkspaceRole.member, nullable=False)
 
 
 class UserDB(UserBase, BaseDBModel, table=True):
     __tablename__ = "users"
+    # Mirrors the `index_users_role_created_at` migration. Matches the admin
+    # list's `WHERE role = … ORDER BY created_at DESC, id`, so a filtered page
+    # is an index range scan with no sort step.
+    #
+    # `ix_users_email_lower` (from `index_users_email_lower`) is the only email
+    # index: uniqueness and lookups are case-insensitive, so queries must
+    # compare `func.lower(UserDB.email)` against a lower-cased value.
+    __table_args__ = (
+        Index("ix_users_role_created_at", "role", text("created_at DESC"), "id"),
+        Index(
+            "ix_users_email_lower",
+            text("lower(email)"),
+            unique=True,
+            postgresql_where=text("email IS NOT NULL"),
+        ),
+    )
 
     team_id: UUID | None = Field(
         default=None,
@@ -29,18 +46,36 @@ class UserDB(UserBase, BaseDBModel, table=True):
         nullable=True,
     )
 
-    oauth_accounts: list["OAuthAccountDB"] = Relationship(back_populates="user")
+    # lazy="raise": an implicit load would be a hidden extra query (and fails
+    # outright under asyncio). Callers that need accounts eager-load them
+    # with selectinload(UserDB.oauth_accounts).
+    oauth_accounts: list["OAuthAccountDB"] = Relationship(
+        back_populates="user", sa_relationship_kwargs={"lazy": "raise"}
+    )
 
 
 class OAuthAccountBase(SQLModel):
-    provider: str = Field(index=True)
-    sub_id: str = Field(index=True)
+    provider: str
+    sub_id: str
 
 
 class OAuthAccountDB(OAuthAccountBase, BaseDBModel, table=True):
     __tablename__ = "oauth_accounts"
-    __table_args__ = (UniqueConstraint("provider", "sub_id"),)
+    # Mirrors the `cover_oauth_accounts_provider_sub_id` migration. The OAuth
+    # login lookup filters on (provider, sub_id) and reads only user_id, which
+    # INCLUDE carries in the index leaf: an index-only scan, no heap fetch.
+    __table_args__ = (
+        Index(
+            "ix_oauth_accounts_provider_sub_id",
+            "provider",
+            "sub_id",
+            unique=True,
+            postgresql_include=["user_id"],
+        ),
+    )
 
     user_id: UUID = Field(foreign_key="users.id", nullable=False)
 
-    user: UserDB = Relationship(back_populates="oauth_accounts")
+    user: UserDB = Relationship(
+        back_populates="oauth_accounts", sa_relationship_kwargs={"lazy": "raise"}
+    )
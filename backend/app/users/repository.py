@@ -1,12 +1,15 @@
 from uuid import UUID
 
-from sqlalchemy import func, or_
+from sqlalchemy import delete, exists, func, lambda_stmt, or_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 from sqlmodel import select
 
 from app.pagination import PageParams
 from app.repository import BaseRepository
 from app.users.models import UserDB, WorkspaceRole
+from app.users.schemas import UserCreate
 
 
 def _escape_like(value: str) -> str:
@@ -17,6 +20,11 @@ class UserRepository(BaseRepository[UserDB]):
     def __init__(self, db: AsyncSession):
         super().__init__(UserDB, db)
 
+    async def get(self, id: UUID) -> UserDB | None:
+        # Identity-map aware: the current user, already loaded by the auth
+        # dependency on this request's session, is returned without SQL.
+        return await self.db.get(UserDB, id)
+
     async def list_by_ids(self, user_ids: list[UUID]) -> list[UserDB]:
         if not user_ids:
             return []
@@ -25,9 +33,68 @@ class UserRepository(BaseRepository[UserDB]):
         return list(result.scalars().all())
 
     async def get_by_email(self, email: str) -> UserDB | None:
-        stmt = select(UserDB).where(UserDB.email == email)
-        result = await self.db.execute(stmt)
-        return result.scalar_one_or_none()
+        # Hot path (sign-in, every Slack event): lambda_stmt caches the built
+        # statement for this code site; only `lowered` is re-bound per call.
+        lowered = email.lower()
+        stmt = lambda_stmt(
+            lambda: select(UserDB).where(func.lower(UserDB.email) == lowered)
+        )
+        return await self.db.scalar(stmt)
+
+    async def create_unless_email_taken(self, data: UserCreate) -> UserDB | None:
+        """INSERT ... ON CONFLICT (email) DO NOTHING RETURNING the new row.
+
+        One atomic statement: the unique ``lower(email)`` index arbitrates, so
+        there is no check-then-insert race. Returns None when the email is taken.
+        """
+        stmt = (
+            pg_insert(UserDB)
+            .values(**data.model_dump())
+            .on_conflict_do_nothing(
+                index_elements=[func.lower(UserDB.email)],
+                index_where=UserDB.email.is_not(None),
+            )
+            .returning(UserDB)
+        )
+        return await self.db.scalar(stmt)
+
+    async def update_by_id(self, user_id: UUID, values: dict) -> UserDB | None:
+        """Apply ``values`` in a single UPDATE ... RETURNING (no read first).
+        Returns the updated row, or None when no user has this id."""
+        stmt = (
+            update(UserDB)
+            .where(UserDB.id == user_id)
+            .values(**values)
+            .returning(UserDB)
+        )
+        return await self.db.scalar(stmt)
+
+    async def update_unless_email_taken(
+        self, user_id: UUID, values: dict
+    ) -> UserDB | None:
+        """UPDATE ... RETURNING, skipped when another user holds ``values["email"]``.
+
+        The email-availability check rides in the UPDATE's WHERE clause, so
+        the common case is one round trip. Returns None both when the email
+        is taken and when no user has this id; callers tell them apart.
+        """
+        other = aliased(UserDB)
+        email_taken = exists().where(
+            func.lower(other.email) == values["email"].lower(),
+            other.id != user_id,
+        )
+        stmt = (
+            update(UserDB)
+            .where(UserDB.id == user_id, ~email_taken)
+            .values(**values)
+            .returning(UserDB)
+        )
+        return await self.db.scalar(stmt)
+
+    async def delete_by_id(self, user_id: UUID) -> bool:
+        """Single DELETE ... RETURNING id; False when no user has this id."""
+        stmt = delete(UserDB).where(UserDB.id == user_id).returning(UserDB.id)
+        return await self.db.scalar(stmt) is not None
 
     async def list(
         self,
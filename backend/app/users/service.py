@@ -29,14 +29,11 @@ class UserService(BaseService[UserDB, UserRepository]):
         super().__init__(db, UserRepository(db))
         self.team_repository = TeamRepository(db)
 
-    async def _ensure_email_available(self, email: str) -> None:
-        if await self.repository.get_by_email(email):
-            raise AlreadyExistsError("Email already registered")
-
     async def create(self, data: UserCreate) -> UserDB:
-        if data.email:
-            await self._ensure_email_available(data.email)
-        return await self.repository.create(data)
+        user = await self.repository.create_unless_email_taken(data)
+        if user is None:
+            raise AlreadyExistsError("Email already registered")
+        return user
 
     async def get(self, user_id: UUID) -> UserDB:
         return await self.get_or_404(user_id)
@@ -69,29 +66,42 @@ class UserService(BaseService[UserDB, UserRepository]):
     async def list_by_ids(self, user_ids: list[UUID]) -> list[UserDB]:
         return await self.repository.list_by_ids(user_ids)
 
+    async def _update_or_404(self, user_id: UUID, values: dict) -> UserDB:
+        user = await self.repository.update_by_id(user_id, values)
+        if user is None:
+            raise NotFoundError(self.not_found_message)
+        return user
+
     async def update(self, user_id: UUID, data: UserPatch) -> UserDB:
-        user = await self.get_or_404(user_id)
         update_data = data.model_dump(exclude_unset=True)
-        new_email = update_data.get("email")
-        if "email" in update_data and new_email is not None and new_email != user.email:
-            await self._ensure_email_available(new_email)
-        return await self.repository.update(user, data)
+        if not update_data:
+            return await self.get_or_404(user_id)
+        if update_data.get("email") is None:
+            return await self._update_or_404(user_id, update_data)
+        user = await self.repository.update_unless_email_taken(user_id, update_data)
+        if user is not None:
+            return user
+        # Nothing was updated: only now pay for the lookup that says why.
+        await self.get_or_404(user_id)
+        raise AlreadyExistsError("Email already registered")
 
     async def update_role(self, user_id: UUID, data: UserRolePatch) -> UserDB:
-        user = await self.get_or_404(user_id)
-        return await self.repository.update(user, data)
+        return await self._update_or_404(user_id, {"role": data.role})
 
     async def update_team(self, user_id: UUID, data: UserTeamPatch) -> UserDB:
-        user = await self.get_or_404(user_id)
-        if data.team_id is not None and not await self.team_repository.get(
-            data.team_id
-        ):
+        update_data = data.model_dump(exclude_unset=True)
+        if not update_data:
+            return await self.get_or_404(user_id)
+        team_id = update_data["team_id"]
+        if team_id is not None and not await self.team_repository.get(team_id):
+            # An unknown user still wins over an unknown team, as before.
+            await self.get_or_404(user_id)
             raise NotFoundError("Team not found")
-        return await self.repository.update(user, data)
+        return await self._update_or_404(user_id, update_data)
 
     async def delete(self, user_id: UUID) -> None:
-        user = await self.get_or_404(user_id)
-        await self.repository.delete(user)
+        if not await self.repository.delete_by_id(user_id):
+            raise NotFoundError(self.not_found_message)
 
 
 def get_user_service(db: AsyncSession = Depends(get_db)) -> UserService:
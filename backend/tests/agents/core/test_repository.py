@@ -1,8 +1,9 @@
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+from types import SimpleNamespace
+from uuid import UUID, uuid4
 
 import pytest
+from sqlalchemy.sql.util import find_tables
 
 from app.agents.core.repository import AgentRepository
 from app.agents.models import (
@@ -14,68 +15,91 @@ from app.agents.schemas import AgentCreateDB, AgentPatch, AgentPermissionCreate
 from app.users.models import WorkspaceRole
 
 
-@pytest.fixture
-def mock_db():
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.commit = AsyncMock()
-    db.refresh = AsyncMock()
-    db.delete = AsyncMock()
-    db.flush = AsyncMock()
-    db.execute = AsyncMock()
-    return db
-
-
 @pytest.fixture
 def repo(mock_db):
     return AgentRepository(mock_db)
 
 
+# Fixed defaults for fields no test here inspects; only the primary key gets a
+# fresh id per row.
+_FROZEN_TS = datetime(2024, 1, 1)
+_FROZEN_UUID = UUID(int=0)
+
+
+# Input payloads are only read by the repository, so each is validated once
+# at import and shared; variants come from model_copy().
+_AGENT_X = AgentCreateDB(
+    name="Agent X", instructions="Be helpful", owner_id=_FROZEN_UUID
+)
+_EDITOR_WRITE = AgentPermissionCreate(
+    user_id=UUID(int=1), permission=PermissionLevel.editor
+)
+_MEMBER_WRITE = AgentPermissionCreate(
+    user_id=UUID(int=2), permission=PermissionLevel.member
+)
+
+
 def make_agent(**kwargs):
-    defaults = dict(
-        id=uuid4(),
-        name="Test Agent",
-        instructions="Do stuff",
-        owner_id=uuid4(),
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    return AgentDB(
+        id=kwargs.pop("id", None) or uuid4(),
+        name=kwargs.pop("name", "Test Agent"),
+        instructions=kwargs.pop("instructions", "Do stuff"),
+        owner_id=kwargs.pop("owner_id", _FROZEN_UUID),
+        created_at=kwargs.pop("created_at", _FROZEN_TS),
+        updated_at=kwargs.pop("updated_at", _FROZEN_TS),
+        **kwargs,
     )
-    return AgentDB(**{**defaults, **kwargs})
 
 
 def make_permission(agent_id=None, **kwargs):
-    defaults = dict(
-        id=uuid4(),
-        agent_id=agent_id or uuid4(),
-        user_id=uuid4(),
-        permission=PermissionLevel.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    return AgentUserPermissionDB(
+        id=kwargs.pop("id", None) or uuid4(),
+        agent_id=agent_id or _FROZEN_UUID,
+        user_id=kwargs.pop("user_id", _FROZEN_UUID),
+        permission=kwargs.pop("permission", PermissionLevel.member),
+        created_at=kwargs.pop("created_at", _FROZEN_TS),
+        updated_at=kwargs.pop("updated_at", _FROZEN_TS),
+        **kwargs,
     )
-    return AgentUserPermissionDB(**{**defaults, **kwargs})
+
+
+# Stand-ins for the SQLAlchemy Result shapes the repository consumes: plain
+# objects, much cheaper than a MagicMock attribute chain per test.
+def scalar_result(value):
+    return SimpleNamespace(scalar_one_or_none=lambda: value)
+
+
+def scalars_result(items):
+    return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: items))
+
+
+def rows_result(rows):
+    return SimpleNamespace(all=lambda: rows)
+
+
+def from_tables(stmt) -> set[str]:
+    """Names of the tables in ``stmt``'s FROM clause, joins included — read off
+    the expression tree, without compiling the statement."""
+    return {t.name for f in stmt.get_final_froms() for t in find_tables(f)}
 
 
 # ---------------------------------------------------------------------------
 # get
 # ---------------------------------------------------------------------------
 
+
 async def test_get_returns_agent(repo, mock_db):
     agent = make_agent()
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = agent
-    mock_db.execute.return_value = mock_result
+    mock_db.execute.return_value = scalar_result(agent)
 
     result = await repo.get(agent.id)
 
     assert result is agent
     mock_db.execute.assert_awaited_once()
-    mock_result.scalar_one_or_none.assert_called_once()
 
 
 async def test_get_returns_none_when_not_found(repo, mock_db):
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_db.execute.return_value = mock_result
+    mock_db.execute.return_value = scalar_result(None)
 
     result = await repo.get(uuid4())
 
@@ -86,71 +110,50 @@ async def test_get_returns_none_when_not_found(repo, mock_db):
 # list_with_permissions
 # ---------------------------------------------------------------------------
 
-async def test_list_with_permissions_returns_rows(repo, mock_db):
-    agent = make_agent()
-    mock_result = MagicMock()
-    mock_result.all.return_value = [(agent, None, None)]
-    mock_db.execute.return_value = mock_result
-
-    rows = await repo.list_with_permissions(user_id=uuid4(), user_role=WorkspaceRole.member)
-
-    mock_db.execute.assert_awaited_once()
-    mock_result.all.assert_called_once()
-    assert rows == [(agent, None, None)]
-
-
-async def test_list_with_permissions_non_admin_joins_permissions(repo, mock_db):
-    mock_result = MagicMock()
-    mock_result.all.return_value = []
-    mock_db.execute.return_value = mock_result
 
-    await repo.list_with_permissions(user_id=uuid4(), user_role=WorkspaceRole.member)
-
-    query_str = str(mock_db.execute.call_args[0][0])
-    assert "agent_user_permissions" in query_str
-
-
-async def test_list_with_permissions_admin_skips_permission_join(repo, mock_db):
-    mock_result = MagicMock()
-    mock_result.all.return_value = []
-    mock_db.execute.return_value = mock_result
-
-    await repo.list_with_permissions(user_id=uuid4(), user_role=WorkspaceRole.admin)
-
-    query_str = str(mock_db.execute.call_args[0][0])
-    assert "agent_user_permissions" not in query_str
-
-
-async def test_list_with_permissions_no_user_skips_permission_join(repo, mock_db):
-    mock_result = MagicMock()
-    mock_result.all.return_value = []
-    mock_db.execute.return_value = mock_result
+@pytest.mark.parametrize(
+    "rows",
+    [[], [(make_agent(), None, None)]],
+    ids=["empty", "one_row"],
+)
+async def test_list_with_permissions_returns_rows(repo, mock_db, rows):
+    mock_db.execute.return_value = rows_result(rows)
 
-    await repo.list_with_permissions(user_id=None, user_role=None)
+    result = await repo.list_with_permissions(
+        user_id=_FROZEN_UUID, user_role=WorkspaceRole.member
+    )
 
-    query_str = str(mock_db.execute.call_args[0][0])
-    assert "agent_user_permissions" not in query_str
+    mock_db.execute.assert_awaited_once()
+    assert result == rows
 
 
-async def test_list_with_permissions_returns_empty_list(repo, mock_db):
-    mock_result = MagicMock()
-    mock_result.all.return_value = []
-    mock_db.execute.return_value = mock_result
+@pytest.mark.parametrize(
+    ("user_id", "role", "expect_join"),
+    [
+        (_FROZEN_UUID, WorkspaceRole.member, True),
+        (_FROZEN_UUID, WorkspaceRole.admin, False),
+        (None, None, False),
+    ],
+    ids=["member", "admin", "no_user"],
+)
+async def test_list_with_permissions_joins_permissions_for_non_admins(
+    repo, mock_db, user_id, role, expect_join
+):
+    mock_db.execute.return_value = rows_result([])
 
-    result = await repo.list_with_permissions(user_id=None, user_role=None)
+    await repo.list_with_permissions(user_id=user_id, user_role=role)
 
-    assert result == []
+    stmt = mock_db.execute.call_args[0][0]
+    assert ("agent_user_permissions" in from_tables(stmt)) is expect_join
 
 
 # ---------------------------------------------------------------------------
 # create
 # ---------------------------------------------------------------------------
 
-async def test_create_adds_commits_and_refreshes(repo, mock_db):
-    owner_id = uuid4()
-    data = AgentCreateDB(name="Agent X", instructions="Be helpful", owner_id=owner_id)
 
-    result = await repo.create(data)
+async def test_create_adds_commits_and_refreshes(repo, mock_db):
+    result = await repo.create(_AGENT_X)
 
     mock_db.add.assert_called_once()
     mock_db.flush.assert_awaited_once()
@@ -160,13 +163,13 @@ async def test_create_adds_commits_and_refreshes(repo, mock_db):
     assert isinstance(added, AgentDB)
     assert added.name == "Agent X"
     assert added.instructions == "Be helpful"
-    assert added.owner_id == owner_id
+    assert added.owner_id == _AGENT_X.owner_id
     assert result is added
 
 
 async def test_create_returns_validated_agent_db(repo, mock_db):
     owner_id = uuid4()
-    data = AgentCreateDB(name="X", instructions="Y", owner_id=owner_id, emoji="🤖")
+    data = _AGENT_X.model_copy(update={"owner_id": owner_id, "emoji": "🤖"})
 
     result = await repo.create(data)
 
@@ -178,6 +181,7 @@ async def test_create_returns_validated_agent_db(repo, mock_db):
 # update
 # ---------------------------------------------------------------------------
 
+
 async def test_update_applies_all_fields(repo, mock_db):
     agent = make_agent(name="Old Name", emoji=None)
 
@@ -193,9 +197,11 @@ async def test_update_flushes_and_refreshes(repo, mock_db):
 
     await repo.update(agent, AgentPatch(name="Updated"))
 
-    mock_db.add.assert_called_once_with(agent)
+    assert mock_db.add.call_count == 1
+    assert mock_db.add.call_args.args[0] is agent
     mock_db.flush.assert_awaited_once()
-    mock_db.refresh.assert_awaited_once_with(agent)
+    assert mock_db.refresh.await_count == 1
+    assert mock_db.refresh.await_args.args[0] is agent
 
 
 async def test_update_with_empty_schema_leaves_agent_unchanged(repo, mock_db):
@@ -211,13 +217,15 @@ async def test_update_with_empty_schema_leaves_agent_unchanged(repo, mock_db):
 # archive
 # ---------------------------------------------------------------------------
 
+
 async def test_archive_sets_is_archived_and_flushes(repo, mock_db):
     agent = make_agent()
 
     await repo.archive(agent)
 
     assert agent.is_archived is True
-    mock_db.add.assert_called_once_with(agent)
+    assert mock_db.add.call_count == 1
+    assert mock_db.add.call_args.args[0] is agent
     mock_db.flush.assert_awaited_once()
 
 
@@ -225,12 +233,11 @@ async def test_archive_sets_is_archived_and_flushes(repo, mock_db):
 # get_permissions
 # ---------------------------------------------------------------------------
 
+
 async def test_get_permissions_returns_list(repo, mock_db):
     agent_id = uuid4()
     perm = make_permission(agent_id=agent_id)
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [perm]
-    mock_db.execute.return_value = mock_result
+    mock_db.execute.return_value = scalars_result([perm])
 
     result = await repo.get_permissions(agent_id)
 
@@ -239,9 +246,7 @@ async def test_get_permissions_returns_list(repo, mock_db):
 
 
 async def test_get_permissions_returns_empty_list_when_none(repo, mock_db):
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = []
-    mock_db.execute.return_value = mock_result
+    mock_db.execute.return_value = scalars_result([])
 
     result = await repo.get_permissions(uuid4())
 
@@ -252,64 +257,32 @@ async def test_get_permissions_returns_empty_list_when_none(repo, mock_db):
 # set_permissions
 # ---------------------------------------------------------------------------
 
-async def test_set_permissions_deletes_existing_before_inserting(repo, mock_db):
-    agent_id = uuid4()
-    existing = make_permission(agent_id=agent_id)
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [existing]
-    mock_db.execute.return_value = mock_result
-
-    new_write = AgentPermissionCreate(user_id=uuid4(), permission=PermissionLevel.editor)
-    await repo.set_permissions(agent_id, [new_write])
 
-    mock_db.delete.assert_awaited_once_with(existing)
-    assert mock_db.flush.await_count == 2
-
-
-async def test_set_permissions_inserts_new_permissions(repo, mock_db):
-    agent_id = uuid4()
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = []
-    mock_db.execute.return_value = mock_result
-
-    new_user_id = uuid4()
-    new_write = AgentPermissionCreate(user_id=new_user_id, permission=PermissionLevel.editor)
-    result = await repo.set_permissions(agent_id, [new_write])
-
-    mock_db.add.assert_called_once()
-    added = mock_db.add.call_args[0][0]
-    assert isinstance(added, AgentUserPermissionDB)
-    assert added.agent_id == agent_id
-    assert added.user_id == new_user_id
-    assert added.permission == PermissionLevel.editor
-    assert len(result) == 1
-
-
-async def test_set_permissions_with_empty_list_clears_all(repo, mock_db):
-    agent_id = uuid4()
-    existing = make_permission(agent_id=agent_id)
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = [existing]
-    mock_db.execute.return_value = mock_result
-
-    result = await repo.set_permissions(agent_id, [])
-
-    mock_db.delete.assert_awaited_once_with(existing)
-    mock_db.add.assert_not_called()
-    assert result == []
-
-
-async def test_set_permissions_refreshes_each_new_permission(repo, mock_db):
+@pytest.mark.parametrize(
+    ("existing_count", "writes"),
+    [
+        (1, [_EDITOR_WRITE]),
+        (0, [_EDITOR_WRITE]),
+        (1, []),
+        (0, [_MEMBER_WRITE, _EDITOR_WRITE]),
+    ],
+    ids=["replaces_existing", "inserts_new", "empty_list_clears_all", "inserts_many"],
+)
+async def test_set_permissions_replaces_existing_with_writes(
+    repo, mock_db, existing_count, writes
+):
     agent_id = uuid4()
-    mock_result = MagicMock()
-    mock_result.scalars.return_value.all.return_value = []
-    mock_db.execute.return_value = mock_result
+    existing = [make_permission(agent_id=agent_id) for _ in range(existing_count)]
+    mock_db.execute.return_value = scalars_result(existing)
 
-    writes = [
-        AgentPermissionCreate(user_id=uuid4(), permission=PermissionLevel.member),
-        AgentPermissionCreate(user_id=uuid4(), permission=PermissionLevel.editor),
-    ]
     result = await repo.set_permissions(agent_id, writes)
 
-    assert mock_db.refresh.await_count == 2
-    assert len(result) == 2
+    # Every existing row is deleted and flushed before the new rows are added.
+    assert [c.args[0] for c in mock_db.delete.await_args_list] == existing
+    assert mock_db.flush.await_count == 2
+    assert [c.args[0] for c in mock_db.add.call_args_list] == result
+    assert mock_db.refresh.await_count == len(writes)
+    assert all(isinstance(p, AgentUserPermissionDB) for p in result)
+    assert [(p.agent_id, p.user_id, p.permission) for p in result] == [
+        (agent_id, w.user_id, w.permission) for w in writes
+    ]
@@ -4,6 +4,7 @@ from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy.engine import Result
 
 from app.agents.models import AgentDB
 from app.threads.models import ThreadDB, ThreadSource
@@ -25,13 +26,13 @@ def test_create_agent(client: TestClient, mock_db, editor_user):
         obj.updated_at = datetime.now()
         created["agent"] = obj
 
-    mock_db.refresh = mock_refresh
+    mock_db.refresh.side_effect = mock_refresh
 
     # One result shape serves every post-create query: the binding/subagent
     # lookups consume .scalars().all() (empty), the final get consumes .all()
     # (the created agent row).
     def execute_side_effect(*_args, **_kwargs):
-        result = MagicMock()
+        result = MagicMock(spec=Result)
         result.scalars.return_value.all.return_value = []
         result.all.return_value = (
             [(created["agent"], None, None)] if "agent" in created else []
@@ -72,7 +73,7 @@ def test_get_agents(client: TestClient, mock_db, current_user):
         updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.all.return_value = [(agent1, None, None), (agent2, None, None)]
     mock_db.execute.return_value = mock_result
 
@@ -94,7 +95,7 @@ def test_get_agents_filter_by_owner(client: TestClient, mock_db, current_user):
         updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.all.return_value = [(agent, None, None)]
     mock_db.execute.return_value = mock_result
 
@@ -118,7 +119,7 @@ def test_get_agent(client: TestClient, mock_db, current_user):
         updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.all.return_value = [(agent, None)]
     mock_db.execute.return_value = mock_result
 
@@ -134,7 +135,7 @@ def test_get_agent_not_found(client: TestClient, mock_db):
     """Test getting a non-existent agent returns 404."""
     fake_id = uuid4()
 
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.all.return_value = []
     mock_db.execute.return_value = mock_result
 
@@ -200,7 +201,7 @@ def test_update_agent_not_found(client: TestClient, mock_db):
     """Test updating a non-existent agent returns 404."""
     fake_id = uuid4()
 
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.all.return_value = []
     mock_db.execute.return_value = mock_result
 
@@ -254,7 +255,7 @@ def test_delete_agent(client: TestClient, mock_db, current_user):
         updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.scalar_one_or_none.return_value = agent
     mock_db.execute.return_value = mock_result
 
@@ -268,7 +269,7 @@ def test_delete_agent_not_found(client: TestClient, mock_db):
     """Test deleting a non-existent agent returns 404."""
     fake_id = uuid4()
 
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.scalar_one_or_none.return_value = None
     mock_db.execute.return_value = mock_result
 
@@ -292,7 +293,7 @@ def test_delete_agent_forbidden_for_non_owner(
         updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.scalar_one_or_none.return_value = agent
     mock_db.execute.return_value = mock_result
 
@@ -314,7 +315,7 @@ def test_delete_agent_allows_workspace_admin(client: TestClient, mock_db, admin_
         updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.scalar_one_or_none.return_value = agent
     mock_db.execute.return_value = mock_result
 
@@ -340,7 +341,7 @@ def test_get_agents_archived_passthrough(client: TestClient, mock_db, current_us
         created_at=datetime.now(),
         updated_at=datetime.now(),
     )
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.all.return_value = [(agent, None, None)]
     mock_db.execute.return_value = mock_result
 
@@ -362,7 +363,7 @@ def test_restore_agent_as_owner(client: TestClient, mock_db, current_user):
         created_at=datetime.now(),
         updated_at=datetime.now(),
     )
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.all.return_value = [(agent, None)]
     mock_result.scalar_one_or_none.return_value = agent
     mock_db.execute.return_value = mock_result
@@ -397,7 +398,7 @@ def test_delete_agent_permanently_forbidden_for_non_manager(
         created_at=datetime.now(),
         updated_at=datetime.now(),
     )
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.all.return_value = [(agent, None)]
     mock_db.execute.return_value = mock_result
 
@@ -1,6 +1,6 @@
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 import pytest
 
@@ -28,18 +28,6 @@ from app.users.models import WorkspaceRole
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def mock_db():
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.commit = AsyncMock()
-    db.refresh = AsyncMock()
-    db.delete = AsyncMock()
-    db.execute = AsyncMock()
-    db.flush = AsyncMock()
-    return db
-
-
 @pytest.fixture
 def mock_repo():
     repo = MagicMock()
@@ -135,32 +123,27 @@ def service(
 # ---------------------------------------------------------------------------
 
 
-def make_agent(**kwargs):
-    defaults = {
-        "id": uuid4(),
-        "name": "Test Agent",
-        "instructions": "Be helpful",
-        "owner_id": uuid4(),
-        "emoji": None,
-        "description": None,
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-    }
-    return AgentDB(**{**defaults, **kwargs})
-
-
-_UNSET = object()
+# Fixed values for tests that only need "some" timestamp or "some other"
+# user id; ids that must be distinct per test still come from uuid4().
+_FIXED_NOW = datetime(2024, 1, 1)
+_UID_A = UUID(int=1)
+_UID_B = UUID(int=2)
+_AGENT_TEMPLATE_KWARGS = {
+    "name": "Test Agent",
+    "instructions": "Be helpful",
+    "emoji": None,
+    "description": None,
+    "created_at": _FIXED_NOW,
+    "updated_at": _FIXED_NOW,
+}
 
 
-def _make_mock_execute_result(*, rows=_UNSET, scalar=_UNSET, scalars_list=_UNSET):
-    result = MagicMock()
-    if rows is not _UNSET:
-        result.all.return_value = rows
-    if scalar is not _UNSET:
-        result.scalar_one_or_none.return_value = scalar
-    if scalars_list is not _UNSET:
-        result.scalars.return_value.all.return_value = scalars_list
-    return result
+def make_agent(**kwargs):
+    return AgentDB(
+        id=kwargs.pop("id", None) or uuid4(),
+        owner_id=kwargs.pop("owner_id", None) or uuid4(),
+        **{**_AGENT_TEMPLATE_KWARGS, **kwargs},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -290,8 +273,8 @@ async def test_get_agent_includes_mcp_servers_from_bindings(service, mock_repo):
         agent_id=agent.id,
         mcp_server_id=server_id,
         tools=tools,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
     )
     mock_repo.list_with_permissions.return_value = [(agent, binding)]
 
@@ -341,16 +324,16 @@ async def test_list_agents_deduplicates_multiple_bindings_per_agent(service, moc
         agent_id=agent.id,
         mcp_server_id=uuid4(),
         tools=None,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
     )
     binding2 = AgentMCPServerDB(
         id=uuid4(),
         agent_id=agent.id,
         mcp_server_id=uuid4(),
         tools=None,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
     )
     mock_repo.list_with_permissions.return_value = [
         (agent, binding1),
@@ -423,8 +406,8 @@ async def test_list_attaches_tag(service, mock_repo, mock_tag_service):
         TagDB(
             id=tag_id,
             name="Data",
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=_FIXED_NOW,
+            updated_at=_FIXED_NOW,
         )
     ]
 
@@ -451,13 +434,18 @@ async def test_list_untagged_agents_attach_no_tag(service, mock_repo, mock_tag_s
 # ---------------------------------------------------------------------------
 
 
+def make_patch(**kwargs):
+    """Unvalidated AgentPatch: these tests only hand it to a mocked repo."""
+    return AgentPatch.model_construct(**kwargs)
+
+
 async def test_update_agent_delegates_to_repository(service, mock_repo):
     agent = make_agent()
     mock_repo.get.return_value = agent
     mock_repo.list_with_permissions.return_value = [(agent, None)]
 
     result = await service.update(
-        agent.id, AgentPatch(name="Updated"), user_id=agent.owner_id
+        agent.id, make_patch(name="Updated"), user_id=agent.owner_id
     )
 
     mock_repo.get.assert_awaited_once_with(agent.id)
@@ -475,7 +463,7 @@ async def test_update_agent_passes_only_set_fields(service, mock_repo):
     mock_repo.get.return_value = agent
     mock_repo.list_with_permissions.return_value = [(agent, None)]
 
-    await service.update(agent.id, AgentPatch(name="New Name"), user_id=agent.owner_id)
+    await service.update(agent.id, make_patch(name="New Name"), user_id=agent.owner_id)
 
     update_schema = mock_repo.update.call_args[0][1]
     assert isinstance(update_schema, AgentPatch)
@@ -486,7 +474,7 @@ async def test_update_agent_raises_404_when_not_found(service, mock_repo):
     mock_repo.list_with_permissions.return_value = []
 
     with pytest.raises(NotFoundError) as exc_info:
-        await service.update(uuid4(), AgentPatch(name="X"))
+        await service.update(uuid4(), make_patch(name="X"))
 
     assert exc_info.value.detail == "Agent not found"
     mock_repo.update.assert_not_called()
@@ -497,7 +485,7 @@ async def test_update_agent_raises_403_when_no_permission(service, mock_repo):
     mock_repo.list_with_permissions.return_value = [(agent, None)]
 
     with pytest.raises(PermissionDeniedError):
-        await service.update(agent.id, AgentPatch(name="X"), user_id=uuid4())
+        await service.update(agent.id, make_patch(name="X"), user_id=uuid4())
 
     mock_repo.get.assert_not_called()
     mock_repo.update.assert_not_called()
@@ -510,7 +498,7 @@ async def test_update_agent_allows_workspace_admin(service, mock_repo):
 
     await service.update(
         agent.id,
-        AgentPatch(name="Renamed"),
+        make_patch(name="Renamed"),
         user_id=uuid4(),
         user_role=WorkspaceRole.admin,
     )
@@ -524,7 +512,7 @@ async def test_update_agent_validates_tag_exists(service, mock_repo, mock_tag_se
     mock_repo.list_with_permissions.return_value = [(agent, None)]
     tag_id = uuid4()
 
-    await service.update(agent.id, AgentPatch(tag_id=tag_id), user_id=agent.owner_id)
+    await service.update(agent.id, make_patch(tag_id=tag_id), user_id=agent.owner_id)
 
     mock_tag_service.get.assert_awaited_once_with(tag_id)
     mock_repo.update.assert_awaited_once()
@@ -539,7 +527,7 @@ async def test_update_agent_raises_404_for_unknown_tag(
 
     with pytest.raises(NotFoundError) as exc_info:
         await service.update(
-            agent.id, AgentPatch(tag_id=uuid4()), user_id=agent.owner_id
+            agent.id, make_patch(tag_id=uuid4()), user_id=agent.owner_id
         )
 
     assert exc_info.value.detail == "Tag not found"
@@ -553,7 +541,7 @@ async def test_update_agent_untag_skips_tag_lookup(
     mock_repo.get.return_value = agent
     mock_repo.list_with_permissions.return_value = [(agent, None)]
 
-    await service.update(agent.id, AgentPatch(tag_id=None), user_id=agent.owner_id)
+    await service.update(agent.id, make_patch(tag_id=None), user_id=agent.owner_id)
 
     mock_tag_service.get.assert_not_called()
     update_schema = mock_repo.update.call_args[0][1]
@@ -904,8 +892,8 @@ async def test_check_ready_returns_not_configured_when_tools_is_none(
         agent_id=agent.id,
         mcp_server_id=server_id,
         tools=None,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
     )
     mock_repo.list_with_permissions.return_value = [(agent, binding)]
 
@@ -915,9 +903,9 @@ async def test_check_ready_returns_not_configured_when_tools_is_none(
     assert result["status"] == "not_configured"
 
 
-async def test_check_ready_returns_ready_when_all_servers_connected(
-    service, mock_db, mock_repo
-):
+@pytest.fixture
+def bound_agent(mock_db, mock_repo, execute_result):
+    """An agent with one configured MCP binding, wired for describe_readiness."""
     agent = make_agent()
     server_id = uuid4()
     binding = AgentMCPServerDB(
@@ -925,78 +913,36 @@ async def test_check_ready_returns_ready_when_all_servers_connected(
         agent_id=agent.id,
         mcp_server_id=server_id,
         tools={"search": ToolStatus.always_allow},
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
     )
     mcp_server = MagicMock()
     mcp_server.id = server_id
-
     mock_repo.list_with_permissions.return_value = [(agent, binding)]
-    mock_db.execute.return_value = _make_mock_execute_result(scalars_list=[mcp_server])
+    mock_db.execute.return_value = execute_result(scalars_list=[mcp_server])
+    return agent, server_id
 
-    with patch(
-        "app.agents.core.service.is_authorized",
-        new=AsyncMock(return_value=True),
-    ):
-        result = await service.describe_readiness(agent.id, "user-id")
 
-    assert result["ready"] is True
-    assert result["disconnected_servers"] == []
-
-
-async def test_check_ready_returns_not_ready_when_server_disconnected(
-    service, mock_db, mock_repo
+@pytest.mark.parametrize(
+    "authorized", [True, False], ids=["all_connected", "server_disconnected"]
+)
+async def test_check_ready_reports_server_authorization(
+    service, bound_agent, authorized
 ):
-    agent = make_agent()
-    server_id = uuid4()
-    binding = AgentMCPServerDB(
-        id=uuid4(),
-        agent_id=agent.id,
-        mcp_server_id=server_id,
-        tools={"search": ToolStatus.always_allow},
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
-    mcp_server = MagicMock()
-    mcp_server.id = server_id
-
-    mock_repo.list_with_permissions.return_value = [(agent, binding)]
-    mock_db.execute.return_value = _make_mock_execute_result(scalars_list=[mcp_server])
-
-    with patch(
-        "app.agents.core.service.is_authorized",
-        new=AsyncMock(return_value=False),
-    ):
-        result = await service.describe_readiness(agent.id, "user-id")
-
-    assert result["ready"] is False
-    assert str(server_id) in result["disconnected_servers"]
-
-
-async def test_check_ready_disconnected_status_label(service, mock_db, mock_repo):
-    agent = make_agent()
-    server_id = uuid4()
-    binding = AgentMCPServerDB(
-        id=uuid4(),
-        agent_id=agent.id,
-        mcp_server_id=server_id,
-        tools={"x": ToolStatus.always_allow},
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
-    mcp_server = MagicMock()
-    mcp_server.id = server_id
-
-    mock_repo.list_with_permissions.return_value = [(agent, binding)]
-    mock_db.execute.return_value = _make_mock_execute_result(scalars_list=[mcp_server])
+    agent, server_id = bound_agent
 
     with patch(
         "app.agents.core.service.is_authorized",
-        new=AsyncMock(return_value=False),
+        new=AsyncMock(return_value=authorized),
     ):
         result = await service.describe_readiness(agent.id, "user-id")
 
-    assert result["status"] == "disconnected"
+    assert result["ready"] is authorized
+    if authorized:
+        assert result["disconnected_servers"] == []
+    else:
+        assert result["disconnected_servers"] == [str(server_id)]
+        assert result["status"] == "disconnected"
 
 
 def _readiness_resp(mcp_server_ids, *, subagent_ids=(), tools_ok=True):
@@ -1013,7 +959,9 @@ def _readiness_resp(mcp_server_ids, *, subagent_ids=(), tools_ok=True):
     return resp
 
 
-async def test_describe_readiness_includes_subagent_servers(service, mock_db):
+async def test_describe_readiness_includes_subagent_servers(
+    service, mock_db, execute_result
+):
     # The bug: a subagent's unauthorized OAuth server must keep the agent "not
     # ready" — otherwise the run launches and fails mid-flight.
     parent_id, sub_id = uuid4(), uuid4()
@@ -1023,7 +971,7 @@ async def test_describe_readiness_includes_subagent_servers(service, mock_db):
         sub_id: _readiness_resp([sub_server]),
     }
     service.get = AsyncMock(side_effect=lambda aid, **_: responses[aid])
-    mock_db.execute.return_value = _make_mock_execute_result(
+    mock_db.execute.return_value = execute_result(
         scalars_list=[MagicMock(id=parent_server), MagicMock(id=sub_server)]
     )
 
@@ -1078,86 +1026,41 @@ async def test_describe_readiness_flags_unconfigured_shared_subagent_binding(ser
 # ---------------------------------------------------------------------------
 
 
-def test_resolve_permission_returns_owner_when_owner(service):
-    owner_id = uuid4()
-    agent = make_agent(owner_id=owner_id)
-
-    result = service._resolve_permission(agent, owner_id, WorkspaceRole.member, {})
-
-    assert result == "owner"
-
-
-def test_resolve_permission_returns_admin_when_admin_role(service):
-    agent = make_agent()
-
-    result = service._resolve_permission(agent, uuid4(), WorkspaceRole.admin, {})
-
-    assert result == "admin"
-
-
-def test_resolve_permission_owner_takes_priority_over_admin(service):
-    owner_id = uuid4()
-    agent = make_agent(owner_id=owner_id)
-
-    result = service._resolve_permission(agent, owner_id, WorkspaceRole.admin, {})
-
-    assert result == "owner"
-
-
-def test_resolve_permission_returns_granted_permission(service):
-    agent = make_agent()
-    granted = {agent.id: "editor"}
-
-    result = service._resolve_permission(agent, uuid4(), WorkspaceRole.member, granted)
-
-    assert result == "editor"
-
-
-def test_resolve_permission_returns_none_when_no_match(service):
-    agent = make_agent()
-
-    result = service._resolve_permission(agent, uuid4(), WorkspaceRole.member, {})
-
-    assert result is None
-
-
-def test_resolve_permission_returns_none_when_no_user(service):
-    agent = make_agent()
-
-    result = service._resolve_permission(agent, None, None, {})
-
-    assert result is None
-
-
-def test_resolve_permission_returns_member_when_team_granted(service):
-    agent = make_agent()
-
-    result = service._resolve_permission(
-        agent, uuid4(), WorkspaceRole.member, {}, {agent.id}
-    )
-
-    assert result == "member"
-
-
-def test_resolve_permission_explicit_grant_beats_team(service):
-    agent = make_agent()
-    granted = {agent.id: "editor"}
-
-    result = service._resolve_permission(
-        agent, uuid4(), WorkspaceRole.member, granted, {agent.id}
-    )
-
-    assert result == "editor"
-
-
-def test_resolve_permission_no_team_grant_when_agent_not_in_set(service):
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    ("user", "role", "explicit", "team", "expected"),
+    [
+        ("owner", WorkspaceRole.member, None, None, "owner"),
+        ("other", WorkspaceRole.admin, None, None, "admin"),
+        ("owner", WorkspaceRole.admin, None, None, "owner"),
+        ("other", WorkspaceRole.member, "editor", None, "editor"),
+        ("other", WorkspaceRole.member, None, None, None),
+        (None, None, None, None, None),
+        ("other", WorkspaceRole.member, None, "agent", "member"),
+        ("other", WorkspaceRole.member, "editor", "agent", "editor"),
+        ("other", WorkspaceRole.member, None, "other", None),
+    ],
+    ids=[
+        "owner",
+        "admin",
+        "owner_over_admin",
+        "granted",
+        "no_match",
+        "no_user",
+        "team_granted",
+        "explicit_over_team",
+        "agent_not_in_team_set",
+    ],
+)
+def test_resolve_permission(service, user, role, explicit, team, expected):
     agent = make_agent()
+    user_id = {"owner": agent.owner_id, "other": _UID_A, None: None}[user]
+    granted = {agent.id: explicit} if explicit else {}
+    team_agent_ids = {"agent": {agent.id}, "other": {_UID_B}, None: None}[team]
 
-    result = service._resolve_permission(
-        agent, uuid4(), WorkspaceRole.member, {}, {uuid4()}
-    )
+    result = service._resolve_permission(agent, user_id, role, granted, team_agent_ids)
 
-    assert result is None
+    assert result == expected
 
 
 # ---------------------------------------------------------------------------
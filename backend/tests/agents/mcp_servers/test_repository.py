@@ -1,38 +1,31 @@
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.engine import Result
 
 from app.agents.mcp_servers.repository import AgentMCPServerRepository
 from app.agents.models import AgentMCPServerBase, AgentMCPServerDB
 from app.agents.schemas import AgentMCPServerPatch
 
 
-@pytest.fixture
-def mock_db():
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.commit = AsyncMock()
-    db.refresh = AsyncMock()
-    db.delete = AsyncMock()
-    db.flush = AsyncMock()
-    db.execute = AsyncMock()
-    return db
-
-
 @pytest.fixture
 def repo(mock_db):
     return AgentMCPServerRepository(mock_db)
 
 
+# No test here inspects the timestamps; a constant avoids a clock read per link.
+_FIXED_NOW = datetime(2024, 1, 1)
+
+
 def make_link(**kwargs):
     defaults = dict(
         id=uuid4(),
         agent_id=uuid4(),
         mcp_server_id=uuid4(),
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
     )
     return AgentMCPServerDB(**{**defaults, **kwargs})
 
@@ -43,7 +36,7 @@ def make_link(**kwargs):
 
 async def test_get_returns_link(repo, mock_db):
     link = make_link()
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.scalar_one_or_none.return_value = link
     mock_db.execute.return_value = mock_result
 
@@ -54,7 +47,7 @@ async def test_get_returns_link(repo, mock_db):
 
 
 async def test_get_returns_none_when_not_found(repo, mock_db):
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.scalar_one_or_none.return_value = None
     mock_db.execute.return_value = mock_result
 
@@ -97,9 +90,11 @@ async def test_update_applies_fields(repo, mock_db):
     result = await repo.update(link, AgentMCPServerPatch(tools=new_tools))
 
     assert link.tools == new_tools
-    mock_db.add.assert_called_once_with(link)
+    assert mock_db.add.call_count == 1
+    assert mock_db.add.call_args.args[0] is link
     mock_db.flush.assert_awaited_once()
-    mock_db.refresh.assert_awaited_once_with(link)
+    assert mock_db.refresh.await_count == 1
+    assert mock_db.refresh.await_args.args[0] is link
     assert result is link
 
 
@@ -121,7 +116,8 @@ async def test_delete_calls_delete_and_flushes(repo, mock_db):
 
     await repo.delete(link)
 
-    mock_db.delete.assert_awaited_once_with(link)
+    assert mock_db.delete.await_count == 1
+    assert mock_db.delete.await_args.args[0] is link
     mock_db.flush.assert_awaited_once()
 
 
@@ -133,7 +129,7 @@ async def test_delete_calls_delete_and_flushes(repo, mock_db):
 async def test_delete_all_for_agent_deletes_every_link(repo, mock_db):
     agent_id = uuid4()
     links = [make_link(agent_id=agent_id), make_link(agent_id=agent_id)]
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.scalars.return_value.all.return_value = links
     mock_db.execute.return_value = mock_result
 
@@ -144,7 +140,7 @@ async def test_delete_all_for_agent_deletes_every_link(repo, mock_db):
 
 
 async def test_delete_all_for_agent_noop_when_no_links(repo, mock_db):
-    mock_result = MagicMock()
+    mock_result = MagicMock(spec=Result)
     mock_result.scalars.return_value.all.return_value = []
     mock_db.execute.return_value = mock_result
 
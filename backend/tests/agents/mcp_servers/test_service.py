@@ -1,5 +1,6 @@
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 import pytest
@@ -20,32 +21,49 @@ from app.mcp.servers.models import MCPAuthType
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def mock_db():
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.commit = AsyncMock()
-    db.refresh = AsyncMock()
-    db.delete = AsyncMock()
-    db.execute = AsyncMock()
-    return db
+class _FakeLinkRepo:
+    """Stands in for AgentMCPServerRepository: canned returns, recorded calls."""
+
+    def __init__(self):
+        self.get_return: AgentMCPServerDB | None = None
+        self.create_return: AgentMCPServerDB | None = None
+        self.update_return: AgentMCPServerDB | None = None
+        self.list_for_agent_return: list[AgentMCPServerDB] = []
+        self.get_calls: list[tuple] = []
+        self.create_calls: list = []
+        self.update_calls: list[tuple] = []
+        self.delete_calls: list[AgentMCPServerDB] = []
+
+    async def get(self, agent_id, server_id):
+        self.get_calls.append((agent_id, server_id))
+        return self.get_return
+
+    async def create(self, data):
+        self.create_calls.append(data)
+        return self.create_return
+
+    async def update(self, link, data):
+        self.update_calls.append((link, data))
+        return self.update_return
+
+    async def delete(self, link):
+        self.delete_calls.append(link)
+
+    async def list_for_agent(self, agent_id):
+        return self.list_for_agent_return
 
 
 @pytest.fixture
 def mock_repo():
-    repo = MagicMock()
-    repo.get = AsyncMock()
-    repo.create = AsyncMock()
-    repo.update = AsyncMock()
-    repo.delete = AsyncMock()
-    repo.list_for_agent = AsyncMock(return_value=[])
-    return repo
+    return _FakeLinkRepo()
 
 
 @pytest.fixture
 def service(mock_db, mock_repo):
     svc = AgentMCPServerService(mock_db)
     svc.repository = mock_repo
+    # Tool discovery talks to the MCP server; tests assert on this double.
+    svc._sync_tools = AsyncMock()
     return svc
 
 
@@ -54,39 +72,35 @@ def service(mock_db, mock_repo):
 # ---------------------------------------------------------------------------
 
 
-def make_link(**kwargs):
-    defaults = {
-        "id": uuid4(),
-        "agent_id": uuid4(),
-        "mcp_server_id": uuid4(),
-        "tools": None,
-        "created_at": datetime.now(),
-        "updated_at": datetime.now(),
-    }
-    return AgentMCPServerDB(**{**defaults, **kwargs})
+_FIXED_NOW = datetime(2024, 1, 1)
+_LINK_TEMPLATE_KWARGS = {
+    "tools": None,
+    "created_at": _FIXED_NOW,
+    "updated_at": _FIXED_NOW,
+}
 
 
-def make_mcp_server(auth_type=MCPAuthType.none, **kwargs):
-    server = MagicMock()
-    server.id = kwargs.get("id", uuid4())
-    server.name = kwargs.get("name", "Test Server")
-    server.url = kwargs.get("url", "https://mcp.example.com")
-    server.auth_type = auth_type
-    return server
+# The service only reads its input schemas, so the empty ones are shared.
+_EMPTY_PATCH = AgentMCPServerPatch()
+_EMPTY_CREATE = AgentMCPServerCreate()
 
 
-_UNSET = object()
+def make_link(**kwargs):
+    return AgentMCPServerDB(
+        id=kwargs.pop("id", None) or uuid4(),
+        agent_id=kwargs.pop("agent_id", None) or uuid4(),
+        mcp_server_id=kwargs.pop("mcp_server_id", None) or uuid4(),
+        **{**_LINK_TEMPLATE_KWARGS, **kwargs},
+    )
 
 
-def make_mock_execute_result(*, rows=_UNSET, scalar=_UNSET, scalars_list=_UNSET):
-    result = MagicMock()
-    if rows is not _UNSET:
-        result.all.return_value = rows
-    if scalar is not _UNSET:
-        result.scalar_one_or_none.return_value = scalar
-    if scalars_list is not _UNSET:
-        result.scalars.return_value.all.return_value = scalars_list
-    return result
+def make_mcp_server(auth_type=MCPAuthType.none, **kwargs):
+    return SimpleNamespace(
+        id=kwargs.get("id") or uuid4(),
+        name=kwargs.get("name", "Test Server"),
+        url=kwargs.get("url", "https://mcp.example.com"),
+        auth_type=auth_type,
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -95,18 +109,18 @@ def make_mock_execute_result(*, rows=_UNSET, scalar=_UNSET, scalars_list=_UNSET)
 
 
 async def test_update_raises_404_when_not_found(service, mock_repo):
-    mock_repo.get.return_value = None
+    mock_repo.get_return = None
 
     with pytest.raises(NotFoundError) as exc_info:
-        await service.update(uuid4(), uuid4(), AgentMCPServerPatch())
+        await service.update(uuid4(), uuid4(), _EMPTY_PATCH)
 
     assert exc_info.value.detail == "Agent MCP server not found"
 
 
 async def test_update_merges_tools_with_existing(service, mock_repo):
     link = make_link(tools={"search": ToolStatus.always_allow})
-    mock_repo.get.return_value = link
-    mock_repo.update.return_value = link
+    mock_repo.get_return = link
+    mock_repo.update_return = link
 
     await service.update(
         link.agent_id,
@@ -114,7 +128,7 @@ async def test_update_merges_tools_with_existing(service, mock_repo):
         AgentMCPServerPatch(tools={"write": ToolStatus.needs_approval}),
     )
 
-    update_schema = mock_repo.update.call_args[0][1]
+    update_schema = mock_repo.update_calls[0][1]
     assert isinstance(update_schema, AgentMCPServerPatch)
     assert update_schema.tools == {
         "search": ToolStatus.always_allow,
@@ -124,8 +138,8 @@ async def test_update_merges_tools_with_existing(service, mock_repo):
 
 async def test_update_sets_tools_when_no_existing(service, mock_repo):
     link = make_link(tools=None)
-    mock_repo.get.return_value = link
-    mock_repo.update.return_value = link
+    mock_repo.get_return = link
+    mock_repo.update_return = link
 
     await service.update(
         link.agent_id,
@@ -133,15 +147,15 @@ async def test_update_sets_tools_when_no_existing(service, mock_repo):
         AgentMCPServerPatch(tools={"search": ToolStatus.always_allow}),
     )
 
-    update_schema = mock_repo.update.call_args[0][1]
+    update_schema = mock_repo.update_calls[0][1]
     assert isinstance(update_schema, AgentMCPServerPatch)
     assert update_schema.tools == {"search": ToolStatus.always_allow}
 
 
 async def test_update_skips_merge_when_update_tools_is_none(service, mock_repo):
     link = make_link(tools={"search": ToolStatus.always_allow})
-    mock_repo.get.return_value = link
-    mock_repo.update.return_value = link
+    mock_repo.get_return = link
+    mock_repo.update_return = link
 
     await service.update(
         link.agent_id,
@@ -149,7 +163,7 @@ async def test_update_skips_merge_when_update_tools_is_none(service, mock_repo):
         AgentMCPServerPatch(tools=None),
     )
 
-    update_schema = mock_repo.update.call_args[0][1]
+    update_schema = mock_repo.update_calls[0][1]
     assert isinstance(update_schema, AgentMCPServerPatch)
     # tools is present but None — no merge happened
     assert update_schema.tools is None
@@ -162,21 +176,21 @@ async def test_update_skips_merge_when_update_tools_is_none(service, mock_repo):
 
 async def test_delete_delegates_to_repository(service, mock_repo):
     link = make_link()
-    mock_repo.get.return_value = link
+    mock_repo.get_return = link
 
     await service.delete(link.agent_id, link.mcp_server_id)
 
-    mock_repo.get.assert_awaited_once_with(link.agent_id, link.mcp_server_id)
-    mock_repo.delete.assert_awaited_once_with(link)
+    assert mock_repo.get_calls == [(link.agent_id, link.mcp_server_id)]
+    assert mock_repo.delete_calls == [link]
 
 
 async def test_delete_raises_404_when_not_found(service, mock_repo):
-    mock_repo.get.return_value = None
+    mock_repo.get_return = None
 
     with pytest.raises(NotFoundError):
         await service.delete(uuid4(), uuid4())
 
-    mock_repo.delete.assert_not_called()
+    assert mock_repo.delete_calls == []
 
 
 # ---------------------------------------------------------------------------
@@ -184,134 +198,91 @@ async def test_delete_raises_404_when_not_found(service, mock_repo):
 # ---------------------------------------------------------------------------
 
 
-async def test_create_or_update_raises_404_when_server_not_found(service, mock_db):
-    mock_db.execute.return_value = make_mock_execute_result(scalar=None)
+async def test_create_or_update_raises_404_when_server_not_found(
+    service, mock_db, execute_result
+):
+    mock_db.execute.return_value = execute_result(scalar=None)
 
     with pytest.raises(NotFoundError) as exc_info:
-        await service.create_or_update(
-            uuid4(), uuid4(), AgentMCPServerCreate(), "user-id"
-        )
+        await service.create_or_update(uuid4(), uuid4(), _EMPTY_CREATE, "user-id")
 
     assert "MCP server" in exc_info.value.detail
 
 
-async def test_create_or_update_updates_tools_on_existing(service, mock_db, mock_repo):
-    server = make_mcp_server()
-    link = make_link(tools=None)
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
-    mock_repo.get.return_value = link
-    new_tools = {"search": ToolStatus.always_allow}
-
-    result = await service.create_or_update(
-        link.agent_id,
-        server.id,
-        AgentMCPServerCreate(tools=new_tools),
-        "user-id",
-    )
-
-    assert link.tools == new_tools
-    assert result is link
-
-
-async def test_create_or_update_returns_existing_unchanged_when_no_tools(
-    service, mock_db, mock_repo
+@pytest.mark.parametrize(
+    ("existing_tools", "incoming_tools", "expected_tools"),
+    [
+        pytest.param(
+            None,
+            {"search": ToolStatus.always_allow},
+            {"search": ToolStatus.always_allow},
+            id="sets_incoming_tools",
+        ),
+        pytest.param(
+            {"existing": ToolStatus.always_allow},
+            None,
+            {"existing": ToolStatus.always_allow},
+            id="keeps_tools_when_none",
+        ),
+    ],
+)
+async def test_create_or_update_existing_link(
+    service,
+    mock_db,
+    mock_repo,
+    existing_tools,
+    incoming_tools,
+    expected_tools,
+    execute_result,
 ):
     server = make_mcp_server()
-    link = make_link(tools={"existing": ToolStatus.always_allow})
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
-    mock_repo.get.return_value = link
+    link = make_link(tools=existing_tools)
+    mock_db.execute.return_value = execute_result(scalar=server)
+    mock_repo.get_return = link
 
     result = await service.create_or_update(
         link.agent_id,
         server.id,
-        AgentMCPServerCreate(tools=None),
+        AgentMCPServerCreate(tools=incoming_tools),
         "user-id",
     )
 
-    # No commit should happen when tools=None and link exists
     assert result is link
-    assert result.tools == {"existing": ToolStatus.always_allow}
-
-
-async def test_create_or_update_creates_and_fetches_tools_for_no_auth(
-    service, mock_db, mock_repo
-):
-    server = make_mcp_server(auth_type=MCPAuthType.none)
-    link = make_link()
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
-    mock_repo.get.return_value = None
-    mock_repo.create.return_value = link
-
-    with patch.object(service, "_sync_tools", new=AsyncMock()) as mock_fetch:
-        await service.create_or_update(
-            uuid4(), server.id, AgentMCPServerCreate(), "user-id"
-        )
-
-    mock_repo.create.assert_awaited_once()
-    mock_fetch.assert_awaited_once_with(link, server, "user-id")
-
-
-async def test_create_or_update_creates_and_fetches_tools_for_api_key(
-    service, mock_db, mock_repo
-):
-    server = make_mcp_server(auth_type=MCPAuthType.api_key)
-    link = make_link()
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
-    mock_repo.get.return_value = None
-    mock_repo.create.return_value = link
-
-    with patch.object(service, "_sync_tools", new=AsyncMock()) as mock_fetch:
-        await service.create_or_update(
-            uuid4(), server.id, AgentMCPServerCreate(), "user-id"
-        )
-
-    mock_fetch.assert_awaited_once()
-
-
-async def test_create_or_update_oauth_fetches_tools_when_connected(
-    service, mock_db, mock_repo
+    assert result.tools == expected_tools
+    assert mock_repo.create_calls == []
+
+
+@pytest.mark.parametrize(
+    ("auth_type", "authorized", "expect_fetch"),
+    [
+        pytest.param(MCPAuthType.none, False, True, id="no_auth"),
+        pytest.param(MCPAuthType.api_key, False, True, id="api_key"),
+        pytest.param(MCPAuthType.oauth2, True, True, id="oauth_connected"),
+        pytest.param(MCPAuthType.oauth2, False, False, id="oauth_not_connected"),
+    ],
+)
+async def test_create_or_update_creates_link(
+    service, mock_db, mock_repo, auth_type, authorized, expect_fetch, execute_result
 ):
-    server = make_mcp_server(auth_type=MCPAuthType.oauth2)
+    server = make_mcp_server(auth_type=auth_type)
     link = make_link()
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
-    mock_repo.get.return_value = None
-    mock_repo.create.return_value = link
-
-    with (
-        patch(
-            "app.agents.mcp_servers.service.is_authorized",
-            new=AsyncMock(return_value=True),
-        ),
-        patch.object(service, "_sync_tools", new=AsyncMock()) as mock_fetch,
-    ):
-        await service.create_or_update(
-            uuid4(), server.id, AgentMCPServerCreate(), "user-id"
-        )
+    mock_db.execute.return_value = execute_result(scalar=server)
+    mock_repo.create_return = link
 
-    mock_fetch.assert_awaited_once()
-
-
-async def test_create_or_update_oauth_skips_fetch_when_not_connected(
-    service, mock_db, mock_repo
-):
-    server = make_mcp_server(auth_type=MCPAuthType.oauth2)
-    link = make_link()
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
-    mock_repo.get.return_value = None
-    mock_repo.create.return_value = link
-
-    with (
-        patch(
-            "app.agents.mcp_servers.service.is_authorized",
-            new=AsyncMock(return_value=False),
-        ),
-        patch.object(service, "_sync_tools", new=AsyncMock()) as mock_fetch,
+    with patch(
+        "app.agents.mcp_servers.service.is_authorized",
+        new=AsyncMock(return_value=authorized),
     ):
-        await service.create_or_update(
-            uuid4(), server.id, AgentMCPServerCreate(), "user-id"
+        result = await service.create_or_update(
+            uuid4(), server.id, _EMPTY_CREATE, "user-id"
         )
 
-    mock_fetch.assert_not_awaited()
+    assert result is link
+    assert len(mock_repo.create_calls) == 1
+    if expect_fetch:
+        service._sync_tools.assert_awaited_once_with(link, server, "user-id")
+    else:
+        service._sync_tools.assert_not_awaited()
 
 
 # ---------------------------------------------------------------------------
@@ -319,19 +290,21 @@ async def test_create_or_update_oauth_skips_fetch_when_not_connected(
 # ---------------------------------------------------------------------------
 
 
-async def test_set_for_agent_creates_wanted_links(service, mock_db, mock_repo):
+async def test_set_for_agent_creates_wanted_links(
+    service, mock_db, mock_repo, execute_result
+):
     agent_id = uuid4()
     server = make_mcp_server()
     tools = {"search": ToolStatus.needs_approval}
-    mock_repo.list_for_agent.return_value = []
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
+    mock_repo.list_for_agent_return = []
+    mock_db.execute.return_value = execute_result(scalar=server)
 
     await service.set_for_agent(
         agent_id, [AgentMCPServerConfig(mcp_server_id=server.id, tools=tools)]
     )
 
-    mock_repo.create.assert_awaited_once()
-    created = mock_repo.create.call_args[0][0]
+    assert len(mock_repo.create_calls) == 1
+    created = mock_repo.create_calls[0]
     assert created.agent_id == agent_id
     assert created.mcp_server_id == server.id
     assert created.tools == tools
@@ -345,7 +318,7 @@ async def test_set_for_agent_replaces_tools_whole_map(service, mock_repo):
             "write": ToolStatus.always_allow,
         }
     )
-    mock_repo.list_for_agent.return_value = [link]
+    mock_repo.list_for_agent_return = [link]
 
     await service.set_for_agent(
         link.agent_id,
@@ -359,51 +332,55 @@ async def test_set_for_agent_replaces_tools_whole_map(service, mock_repo):
 
     # "write" is gone: the provided map wins wholesale
     assert link.tools == {"search": ToolStatus.disabled}
-    mock_repo.create.assert_not_called()
-    mock_repo.delete.assert_not_called()
+    assert mock_repo.create_calls == []
+    assert mock_repo.delete_calls == []
 
 
-async def test_set_for_agent_preserves_none_tools(service, mock_db, mock_repo):
+async def test_set_for_agent_preserves_none_tools(
+    service, mock_db, mock_repo, execute_result
+):
     """tools=None (never synced) round-trips as None, not {}."""
     server = make_mcp_server()
-    mock_repo.list_for_agent.return_value = []
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
+    mock_repo.list_for_agent_return = []
+    mock_db.execute.return_value = execute_result(scalar=server)
 
     await service.set_for_agent(
         uuid4(), [AgentMCPServerConfig(mcp_server_id=server.id, tools=None)]
     )
 
-    created = mock_repo.create.call_args[0][0]
+    created = mock_repo.create_calls[0]
     assert created.tools is None
 
 
 async def test_set_for_agent_deletes_unwanted_links(service, mock_repo):
     keep = make_link(tools={"a": ToolStatus.always_allow})
     drop = make_link(agent_id=keep.agent_id)
-    mock_repo.list_for_agent.return_value = [keep, drop]
+    mock_repo.list_for_agent_return = [keep, drop]
 
     await service.set_for_agent(
         keep.agent_id,
         [AgentMCPServerConfig(mcp_server_id=keep.mcp_server_id, tools=keep.tools)],
     )
 
-    mock_repo.delete.assert_awaited_once_with(drop)
-    mock_repo.create.assert_not_called()
+    assert mock_repo.delete_calls == [drop]
+    assert mock_repo.create_calls == []
 
 
 async def test_set_for_agent_empty_config_deletes_everything(service, mock_repo):
     link1 = make_link()
     link2 = make_link(agent_id=link1.agent_id)
-    mock_repo.list_for_agent.return_value = [link1, link2]
+    mock_repo.list_for_agent_return = [link1, link2]
 
     await service.set_for_agent(link1.agent_id, [])
 
-    assert mock_repo.delete.await_count == 2
+    assert len(mock_repo.delete_calls) == 2
 
 
-async def test_set_for_agent_raises_404_for_unknown_server(service, mock_db, mock_repo):
-    mock_repo.list_for_agent.return_value = []
-    mock_db.execute.return_value = make_mock_execute_result(scalar=None)
+async def test_set_for_agent_raises_404_for_unknown_server(
+    service, mock_db, mock_repo, execute_result
+):
+    mock_repo.list_for_agent_return = []
+    mock_db.execute.return_value = execute_result(scalar=None)
 
     with pytest.raises(NotFoundError) as exc_info:
         await service.set_for_agent(
@@ -411,21 +388,22 @@ async def test_set_for_agent_raises_404_for_unknown_server(service, mock_db, moc
         )
 
     assert "MCP server" in exc_info.value.detail
-    mock_repo.create.assert_not_called()
+    assert mock_repo.create_calls == []
 
 
-async def test_set_for_agent_never_discovers_tools(service, mock_db, mock_repo):
+async def test_set_for_agent_never_discovers_tools(
+    service, mock_db, mock_repo, execute_result
+):
     """The save path performs zero network calls — no _sync_tools ever."""
     server = make_mcp_server(auth_type=MCPAuthType.none)
-    mock_repo.list_for_agent.return_value = []
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
+    mock_repo.list_for_agent_return = []
+    mock_db.execute.return_value = execute_result(scalar=server)
 
-    with patch.object(service, "_sync_tools", new=AsyncMock()) as mock_fetch:
-        await service.set_for_agent(
-            uuid4(), [AgentMCPServerConfig(mcp_server_id=server.id, tools=None)]
-        )
+    await service.set_for_agent(
+        uuid4(), [AgentMCPServerConfig(mcp_server_id=server.id, tools=None)]
+    )
 
-    mock_fetch.assert_not_awaited()
+    service._sync_tools.assert_not_awaited()
 
 
 # ---------------------------------------------------------------------------
@@ -433,8 +411,10 @@ async def test_set_for_agent_never_discovers_tools(service, mock_db, mock_repo):
 # ---------------------------------------------------------------------------
 
 
-async def test_sync_tools_raises_404_when_server_not_found(service, mock_db):
-    mock_db.execute.return_value = make_mock_execute_result(scalar=None)
+async def test_sync_tools_raises_404_when_server_not_found(
+    service, mock_db, execute_result
+):
+    mock_db.execute.return_value = execute_result(scalar=None)
 
     with pytest.raises(NotFoundError) as exc_info:
         await service.sync_tools(uuid4(), uuid4(), "user-id")
@@ -442,10 +422,12 @@ async def test_sync_tools_raises_404_when_server_not_found(service, mock_db):
     assert "MCP server" in exc_info.value.detail
 
 
-async def test_sync_tools_raises_404_when_link_not_found(service, mock_db, mock_repo):
+async def test_sync_tools_raises_404_when_link_not_found(
+    service, mock_db, mock_repo, execute_result
+):
     server = make_mcp_server()
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
-    mock_repo.get.return_value = None
+    mock_db.execute.return_value = execute_result(scalar=server)
+    mock_repo.get_return = None
 
     with pytest.raises(NotFoundError) as exc_info:
         await service.sync_tools(uuid4(), server.id, "user-id")
@@ -454,15 +436,14 @@ async def test_sync_tools_raises_404_when_link_not_found(service, mock_db, mock_
 
 
 async def test_sync_tools_calls_fetch_and_save_and_returns_link(
-    service, mock_db, mock_repo
+    service, mock_db, mock_repo, execute_result
 ):
     server = make_mcp_server()
     link = make_link()
-    mock_db.execute.return_value = make_mock_execute_result(scalar=server)
-    mock_repo.get.return_value = link
+    mock_db.execute.return_value = execute_result(scalar=server)
+    mock_repo.get_return = link
 
-    with patch.object(service, "_sync_tools", new=AsyncMock()) as mock_fetch:
-        result = await service.sync_tools(uuid4(), server.id, "user-id")
+    result = await service.sync_tools(uuid4(), server.id, "user-id")
 
-    mock_fetch.assert_awaited_once_with(link, server, "user-id")
+    service._sync_tools.assert_awaited_once_with(link, server, "user-id")
     assert result is link
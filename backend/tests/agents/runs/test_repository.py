@@ -203,6 +203,24 @@ async def test_stream_missing_sentinel_backstop(redis, run_db):
     assert "event: end" in chunks[-1] and "error" in chunks[-1]
 
 
+async def test_stream_bytes_coalesces_each_read_batch(redis):
+    """The HTTP relay gets one encoded write per Redis batch, carrying the same
+    bytes `stream` yields event by event."""
+    service = RunService(redis)
+    record = await service.create(thread_id="t9d", user_id=_user(), input={})
+    from app.agents.runs.events import RunEventStream
+
+    events = RunEventStream(record.id, redis)
+    await events.publish('event: messages\ndata: {"a": "é"}\n\n')
+    await events.publish("event: messages\ndata: {}\n\n")
+    await service.finalize(record.id, RunStatus.cancelled)
+
+    chunks = [c async for c in service.stream(record.id, "0")]
+    payloads = [p async for p in service.stream_bytes(record.id, "0")]
+    assert len(payloads) == 1
+    assert payloads[0] == "".join(chunks).encode()
+
+
 async def test_stream_expired_events_yields_synthetic_end(redis):
     """Reattaching to a terminal run after the event log TTL'd must terminate
     immediately instead of blocking on an empty stream."""
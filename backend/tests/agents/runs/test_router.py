@@ -1,5 +1,5 @@
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, patch
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
@@ -52,8 +52,8 @@ class _FakeRunService:
             updated_at=datetime.now(),
         )
 
-    async def stream(self, run_id: str):
-        yield "data: [DONE]\n\n"
+    async def stream_bytes(self, run_id: str):
+        yield b"data: [DONE]\n\n"
 
     async def wait_for_terminal(self, run_id: str) -> RunDB:
         return RunDB(
@@ -66,9 +66,7 @@ class _FakeRunService:
 
 
 def _mock_thread_lookup(mock_db, thread: ThreadDB) -> None:
-    result = MagicMock()
-    result.scalar_one_or_none.return_value = thread
-    mock_db.execute.return_value = result
+    mock_db.get.return_value = thread
 
 
 @patch("app.agents.runs.router.read_run_result", new_callable=AsyncMock)
@@ -127,6 +125,27 @@ def test_invoke_without_output_schema(
     assert fake.create_kwargs["output_schema"] is None
 
 
+def test_invoke_rejects_malformed_body(client: TestClient, mock_db, current_user):
+    """The body is validated from raw bytes; a bad shape is still a 422, and
+    no run is created."""
+    thread = _owned_thread(current_user)
+    _mock_thread_lookup(mock_db, thread)
+    fake = _FakeRunService()
+    app.dependency_overrides[get_run_service] = lambda: fake
+
+    try:
+        response = client.post(
+            f"/threads/{thread.id}/runs/invoke", json={"input": "not-an-object"}
+        )
+    finally:
+        app.dependency_overrides.pop(get_run_service, None)
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"] == ["body", "input"]
+    assert "url" not in response.json()["detail"][0]
+    assert fake.create_kwargs is None
+
+
 @patch("app.agents.runs.router.read_run_result", new_callable=AsyncMock)
 def test_invoke_schema_violating_result_is_500(
     mock_read, client: TestClient, mock_db, current_user
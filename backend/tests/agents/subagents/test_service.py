@@ -14,15 +14,6 @@ from app.users.models import WorkspaceRole
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def mock_db():
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.execute = AsyncMock()
-    db.flush = AsyncMock()
-    return db
-
-
 @pytest.fixture
 def mock_repo():
     repo = MagicMock()
@@ -10,7 +10,6 @@ prefix mutate.
 
 from datetime import UTC, datetime
 
-import pytest
 from langchain_core.messages import SystemMessage
 
 from app.agents.current_date import CurrentDateMiddleware
@@ -42,7 +41,6 @@ async def _run(system_message, middleware=None):
     return captured["message"]
 
 
-@pytest.mark.asyncio
 async def test_string_content_gets_suffix():
     stamped = await _run(SystemMessage("You are a helpful assistant."))
     assert stamped.content == (
@@ -50,7 +48,6 @@ async def test_string_content_gets_suffix():
     )
 
 
-@pytest.mark.asyncio
 async def test_block_content_gets_extra_text_block():
     original = SystemMessage(content=[{"type": "text", "text": "Instructions."}])
     stamped = await _run(original)
@@ -62,14 +59,12 @@ async def test_block_content_gets_extra_text_block():
     }
 
 
-@pytest.mark.asyncio
 async def test_no_system_message_creates_one():
     stamped = await _run(None)
     assert isinstance(stamped, SystemMessage)
     assert stamped.content == "Current date: Tuesday, July 21, 2026 (UTC)"
 
 
-@pytest.mark.asyncio
 async def test_stamp_is_frozen_at_construction():
     """Cache-safety: the stamp comes from the given date, never from now()."""
     middleware = CurrentDateMiddleware(datetime(2025, 1, 1, tzinfo=UTC))
@@ -311,14 +311,12 @@ class TestApplyUiMetadata:
 
 
 class TestToolsetPrepareEmpty:
-    @pytest.mark.asyncio
     async def test_empty_bindings_prepare(self):
         prepared = await Toolset.prepare([], db=None, user_id="u1", apply_ui=True)
         assert prepared.server_names == []
         assert prepared.interrupt_on == {}
         assert prepared.client is None
 
-    @pytest.mark.asyncio
     async def test_empty_bindings_open_yields_empty_toolset(self):
         prepared = await Toolset.prepare([], db=None, user_id="u1", apply_ui=True)
         async with Toolset.open(prepared) as ts:
@@ -351,7 +349,6 @@ class _FakeDB:
 
 
 class TestPrepareDerivesInterruptOn:
-    @pytest.mark.asyncio
     async def test_needs_approval_tools_gate_without_network(self):
         from types import SimpleNamespace
 
@@ -379,7 +376,6 @@ class TestPrepareDerivesInterruptOn:
         assert prepared.interrupt_on == {"sheets_read_range": True}
         assert prepared.server_names == ["sheets"]
 
-    @pytest.mark.asyncio
     async def test_null_tool_map_yields_no_gates(self):
         from types import SimpleNamespace
 
@@ -442,7 +438,6 @@ class _FakeClient:
 
 
 class TestOpenSessions:
-    @pytest.mark.asyncio
     async def test_sessions_open_concurrently(self):
         import time as time_mod
 
@@ -459,7 +454,6 @@ class TestOpenSessions:
         elapsed = time_mod.perf_counter() - t0
         assert elapsed < 0.09  # serial would be >= 0.10
 
-    @pytest.mark.asyncio
     async def test_enter_and_exit_happen_in_same_task(self):
         import asyncio
 
@@ -477,7 +471,6 @@ class TestOpenSessions:
             assert events["enter"] is events["exit"], name
             assert events["enter"] is not main_task, name
 
-    @pytest.mark.asyncio
     async def test_enter_failure_propagates_and_cleans_up_others(self):
         from app.agents.toolset import _open_sessions
 
@@ -491,7 +484,6 @@ class TestOpenSessions:
                 pytest.fail("body must not run when a session fails to open")
         assert any(e == "exit" and n == "ok" for e, n, _ in log)
 
-    @pytest.mark.asyncio
     async def test_teardown_failure_propagates(self):
         from app.agents.toolset import _open_sessions
 
@@ -501,7 +493,6 @@ class TestOpenSessions:
             async with _open_sessions(_FakeClient(cms), ["a"]):
                 pass
 
-    @pytest.mark.asyncio
     async def test_body_exception_wins_over_teardown_error(self):
         from app.agents.toolset import _open_sessions
 
@@ -512,7 +503,6 @@ class TestOpenSessions:
                 raise ValueError("body boom")
         assert any(e == "exit" and n == "a" for e, n, t in log)
 
-    @pytest.mark.asyncio
     async def test_replaced_session_teardown_error_is_excused(self):
         """A dead primary that was replaced mid-stream tears down noisily —
         that error must be logged, not raised at the end of a successful run."""
@@ -528,7 +518,6 @@ class TestOpenSessions:
         ) as sessions:
             assert sessions["dead"] == "session-dead"
 
-    @pytest.mark.asyncio
     async def test_unreplaced_teardown_error_still_raises(self):
         from app.agents.toolset import _open_sessions
 
@@ -579,7 +568,6 @@ class _FakeSupervisor:
 
 
 class TestReconnectingSession:
-    @pytest.mark.asyncio
     async def test_dead_transport_reconnects_and_retries(self):
         import anyio
 
@@ -598,7 +586,6 @@ class TestReconnectingSession:
         assert dead.calls == ["read_channel"]
         assert fresh.calls == ["read_channel"]
 
-    @pytest.mark.asyncio
     async def test_non_transport_errors_are_not_retried(self):
         from app.agents.toolset import ReconnectingSession
 
@@ -610,7 +597,6 @@ class TestReconnectingSession:
             await proxy.call_tool("send_message")
         assert supervisor.reopened == []
 
-    @pytest.mark.asyncio
     async def test_concurrent_failures_reconnect_once(self):
         """N concurrent calls on a dead session must trigger ONE reopen, and
         all of them must retry on the same replacement."""
@@ -632,7 +618,6 @@ class TestReconnectingSession:
         assert sorted(results) == ["fresh:a", "fresh:b", "fresh:c"]
         assert supervisor.reopened == ["slack"]
 
-    @pytest.mark.asyncio
     async def test_second_death_reconnects_again(self):
         import anyio
 
@@ -651,7 +636,6 @@ class TestReconnectingSession:
         assert await proxy.call_tool("b") == "fresh:b"
         assert supervisor.reopened == ["slack", "slack"]
 
-    @pytest.mark.asyncio
     async def test_list_tools_reconnects_and_retries(self):
         """Tool discovery (Toolset.open → load_mcp_tools → list_tools) must
         survive a transport that died right after the session opened, not
@@ -668,7 +652,6 @@ class TestReconnectingSession:
         assert await proxy.list_tools() == "tools-from-fresh"
         assert supervisor.reopened == ["slack"]
 
-    @pytest.mark.asyncio
     async def test_getattr_delegates_to_current_session(self):
         import anyio
 
@@ -691,7 +674,6 @@ class TestReconnectingSession:
 
 
 class TestSessionSupervisor:
-    @pytest.mark.asyncio
     async def test_reopen_hosts_session_and_records_replacement(self):
         import asyncio
 
@@ -712,7 +694,6 @@ class TestSessionSupervisor:
         exit_task = next(t for e, n, t in log if e == "exit")
         assert exit_task is enter_task
 
-    @pytest.mark.asyncio
     async def test_close_logs_teardown_errors_instead_of_raising(self):
         from app.agents.toolset import _SessionSupervisor
 
@@ -723,7 +704,6 @@ class TestSessionSupervisor:
 
         await supervisor.close()  # must not raise
 
-    @pytest.mark.asyncio
     async def test_reopen_failure_propagates_to_caller(self):
         from app.agents.toolset import _SessionSupervisor
 
@@ -1,83 +1,277 @@
-from unittest.mock import AsyncMock, MagicMock
+import asyncio
+from datetime import datetime
+from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
+import pytest_asyncio
 from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.engine import Result
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.auth.dependencies import get_current_user, require_admin, require_editor
 from app.database import get_db
 from app.main import app
+from app.threads.models import ThreadDB
 from app.users.models import UserDB, WorkspaceRole
 
 
+def pytest_collection_modifyitems(items):
+    """Run ``unit``-marked tests first so pure-logic regressions fail fast.
+
+    The sort is stable, so every other test keeps its collection order.
+    """
+    items.sort(key=lambda item: item.get_closest_marker("unit") is None)
+
+
+# One AsyncSession mock and one ASGI transport for the whole run: the app is
+# imported once above, and only the per-test state is reset.
+_SHARED_DB = MagicMock(spec=AsyncSession)
+_TRANSPORT = ASGITransport(app=app)
+
+
+async def _override_get_db():
+    yield _SHARED_DB
+
+
+def pytest_sessionstart(session):
+    app.dependency_overrides[get_db] = _override_get_db
+
+
+def pytest_sessionfinish(session, exitstatus):
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def _no_leaked_tasks():
+    """Fail a test that leaves tasks on the session-wide event loop.
+
+    Every test shares one loop, so a leftover task would otherwise run during
+    (and could fail) a later test instead.
+    """
+    yield
+    pending = asyncio.all_tasks() - {asyncio.current_task()}
+    assert not pending, f"test left tasks on the shared event loop: {pending}"
+
+
+@pytest.fixture(scope="session")
+def _shared_db():
+    """The run-wide AsyncSession mock; ``mock_db`` resets it per test."""
+    return _SHARED_DB
+
+
 @pytest.fixture
-def mock_db():
-    """Create a mock database session."""
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.commit = AsyncMock()
-    db.refresh = AsyncMock()
-    db.delete = AsyncMock()
-    db.execute = AsyncMock()
-    return db
+def mock_db(_shared_db):
+    """The mock database session, reset to a clean slate for this test.
+
+    Configure it through ``return_value``/``side_effect`` rather than by
+    assigning attributes, which would outlive the reset.
+    """
+    _shared_db.reset_mock(return_value=True, side_effect=True)
+    return _shared_db
+
+
+_UNSET = object()
+
+
+@pytest.fixture(scope="session")
+def db_result():
+    """Factory for ``Result`` mocks pre-shaped with what the route reads.
+
+    ``scalar`` feeds ``scalar_one_or_none()``, ``all_`` feeds ``all()`` and
+    ``scalars_all`` feeds ``scalars().all()``; unset accessors stay mocks.
+    """
+
+    def make(
+        *,
+        scalar=_UNSET,
+        scalar_one=_UNSET,
+        one_or_none=_UNSET,
+        all_=_UNSET,
+        scalars_all=_UNSET,
+    ):
+        result = MagicMock(spec=Result)
+        if scalar is not _UNSET:
+            result.scalar_one_or_none.return_value = scalar
+        if scalar_one is not _UNSET:
+            result.scalar_one.return_value = scalar_one
+        if one_or_none is not _UNSET:
+            result.one_or_none.return_value = one_or_none
+        if all_ is not _UNSET:
+            result.all.return_value = all_
+        if scalars_all is not _UNSET:
+            result.scalars.return_value.all.return_value = scalars_all
+        return result
+
+    return make
+
+
+class _FakeScalars:
+    __slots__ = ("_values",)
+
+    def __init__(self, values):
+        self._values = values
+
+    def all(self):
+        return self._values
+
+
+class _FakeResult:
+    """Plain stand-in for the ``Result`` methods the services read."""
+
+    __slots__ = ("_rows", "_scalar", "_scalars_list")
+
+    def __init__(self, rows, scalar, scalars_list):
+        self._rows = rows
+        self._scalar = scalar
+        self._scalars_list = scalars_list
+
+    def all(self):
+        return self._rows
+
+    def scalar_one_or_none(self):
+        return self._scalar
+
+    def scalars(self):
+        return _FakeScalars(self._scalars_list)
+
+
+@pytest.fixture(scope="session")
+def execute_result():
+    """Factory for plain ``Result`` fakes, cheaper to build than ``db_result``.
+
+    ``rows`` feeds ``all()``, ``scalar`` feeds ``scalar_one_or_none()`` and
+    ``scalars_list`` feeds ``scalars().all()``; unset ones read as empty.
+    """
+
+    def make(*, rows=_UNSET, scalar=_UNSET, scalars_list=_UNSET):
+        return _FakeResult(
+            [] if rows is _UNSET else rows,
+            None if scalar is _UNSET else scalar,
+            [] if scalars_list is _UNSET else scalars_list,
+        )
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def _test_client():
+    """Build the TestClient once; per-test wiring happens in ``client``."""
+    return TestClient(app)
 
 
 @pytest.fixture
-def client(mock_db):
+def client(_test_client, mock_db):
     """Create a test client with mocked database dependency."""
+    # The client is shared, so drop any auth cookie a previous test picked up.
+    _test_client.cookies.clear()
+    return _test_client
 
-    async def override_get_db():
-        yield mock_db
 
-    app.dependency_overrides[get_db] = override_get_db
-    client = TestClient(app)
-    yield client
-    app.dependency_overrides.clear()
+@pytest.fixture
+async def async_client(mock_db):
+    """In-process async client with mocked database dependency.
 
+    Requests run on the test's event loop through ``ASGITransport`` rather
+    than on the worker thread ``TestClient`` starts for each call.
+    """
+    async with AsyncClient(transport=_TRANSPORT, base_url="http://test") as client:
+        yield client
 
-@pytest.fixture
-def current_user():
-    """Create a test user and override the get_current_user dependency."""
-    user = UserDB(
+
+# Factory rows never need a real clock reading.
+_FIXED_NOW = datetime(2024, 1, 1)
+_TIMESTAMPS = {"created_at": _FIXED_NOW, "updated_at": _FIXED_NOW}
+_USER_DEFAULTS = {"role": WorkspaceRole.member, **_TIMESTAMPS}
+
+
+@pytest.fixture(scope="session")
+def user_factory():
+    """Build ``UserDB`` rows with an id, member role and timestamps filled in."""
+
+    def make(**kwargs):
+        return UserDB(
+            id=kwargs.pop("id", None) or uuid4(),
+            **{**_USER_DEFAULTS, **kwargs},
+        )
+
+    return make
+
+
+@pytest.fixture(scope="session")
+def thread_factory():
+    """Build ``ThreadDB`` rows with ids and timestamps filled in."""
+
+    def make(**kwargs):
+        return ThreadDB(
+            id=kwargs.pop("id", None) or str(uuid4()),
+            agent_id=kwargs.pop("agent_id", None) or uuid4(),
+            **{**_TIMESTAMPS, **kwargs},
+        )
+
+    return make
+
+
+# The users are plain data shared by every test; only the dependency
+# overrides that authenticate them are per test.
+
+
+@pytest.fixture(scope="session")
+def _member_user():
+    return UserDB(
         id=uuid4(),
         name="Test User",
         email="test@test.com",
         role=WorkspaceRole.member,
-        password_hash="hashed_password"
+        password_hash="hashed_password",
     )
-    app.dependency_overrides[get_current_user] = lambda: user
-    yield user
-    app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def editor_user():
-    """Create an editor user and override get_current_user and require_editor."""
-    user = UserDB(
+@pytest.fixture(scope="session")
+def _editor_user():
+    return UserDB(
         id=uuid4(),
         name="Editor User",
         email="editor@test.com",
         role=WorkspaceRole.editor,
-        password_hash="hashed_password"
+        password_hash="hashed_password",
     )
-    app.dependency_overrides[get_current_user] = lambda: user
-    app.dependency_overrides[require_editor] = lambda: user
-    yield user
-    app.dependency_overrides.clear()
 
 
-@pytest.fixture
-def admin_user():
-    """Create an admin user and override get_current_user, require_editor, and require_admin."""
-    user = UserDB(
+@pytest.fixture(scope="session")
+def _admin_user():
+    return UserDB(
         id=uuid4(),
         name="Admin User",
         email="admin@test.com",
         role=WorkspaceRole.admin,
-        password_hash="hashed_password"
+        password_hash="hashed_password",
     )
-    app.dependency_overrides[get_current_user] = lambda: user
-    app.dependency_overrides[require_editor] = lambda: user
-    app.dependency_overrides[require_admin] = lambda: user
-    yield user
-    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def current_user(_member_user, monkeypatch):
+    """Override the get_current_user dependency with a member."""
+    user = _member_user
+    monkeypatch.setitem(app.dependency_overrides, get_current_user, lambda: user)
+    return user
+
+
+@pytest.fixture
+def editor_user(_editor_user, monkeypatch):
+    """Override get_current_user and require_editor with an editor."""
+    user = _editor_user
+    monkeypatch.setitem(app.dependency_overrides, get_current_user, lambda: user)
+    monkeypatch.setitem(app.dependency_overrides, require_editor, lambda: user)
+    return user
+
+
+@pytest.fixture
+def admin_user(_admin_user, monkeypatch):
+    """Override get_current_user, require_editor, and require_admin with an admin."""
+    user = _admin_user
+    monkeypatch.setitem(app.dependency_overrides, get_current_user, lambda: user)
+    monkeypatch.setitem(app.dependency_overrides, require_editor, lambda: user)
+    monkeypatch.setitem(app.dependency_overrides, require_admin, lambda: user)
+    return user
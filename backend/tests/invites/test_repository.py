@@ -0,0 +1,56 @@
+from datetime import UTC, datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import SQLModel
+
+from app.invites.models import InviteDB, InviteStatus
+from app.invites.repository import InviteRepository
+from app.teams.models import TeamDB
+from app.users.models import UserDB
+
+
+@pytest.fixture
+async def db(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'invites.db'}")
+
+    def _create(conn):
+        SQLModel.metadata.create_all(
+            conn, tables=[TeamDB.__table__, UserDB.__table__, InviteDB.__table__]
+        )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(_create)
+    factory = sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        inviter = UserDB(id=uuid4(), name="Admin", email="admin@example.com")
+        session.add(inviter)
+        session.add(
+            InviteDB(
+                email="Foo@Example.com",
+                token="t1",
+                invited_by=inviter.id,
+                expires_at=datetime.now(UTC) + timedelta(days=7),
+            )
+        )
+        await session.commit()
+        yield session
+    await engine.dispose()
+
+
+async def test_get_pending_by_email_ignores_case(db):
+    invite = await InviteRepository(db).get_pending_by_email("foo@example.com")
+
+    assert invite is not None
+    assert invite.email == "Foo@Example.com"
+
+
+async def test_revoke_pending_by_email_ignores_case(db):
+    repo = InviteRepository(db)
+
+    await repo.revoke_pending_by_email("FOO@example.COM")
+
+    invite = await repo.get_by_token("t1")
+    assert invite.status == InviteStatus.revoked
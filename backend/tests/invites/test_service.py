@@ -3,20 +3,12 @@ from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.engine import Result
 
 from app.invites.models import InviteCreateDB, InviteDB, InviteStatus
 from app.invites.service import InviteService
 
 
-@pytest.fixture
-def mock_db():
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.execute = AsyncMock()
-    db.flush = AsyncMock()
-    return db
-
-
 @pytest.fixture
 def mock_repo():
     repo = MagicMock()
@@ -50,9 +42,9 @@ def make_invite(**kwargs):
 
 async def test_create_persists_team_id(service, mock_db, mock_repo):
     team_id = uuid4()
-    no_user = MagicMock()
+    no_user = MagicMock(spec=Result)
     no_user.scalar_one_or_none.return_value = None
-    team_found = MagicMock()
+    team_found = MagicMock(spec=Result)
     team_found.scalar_one_or_none.return_value = MagicMock()  # team exists
     # 1st execute: email check; 2nd: TeamRepository.get for team validation.
     mock_db.execute.side_effect = [no_user, team_found]
@@ -68,7 +60,7 @@ async def test_create_persists_team_id(service, mock_db, mock_repo):
 
 
 async def test_create_defaults_team_id_to_none(service, mock_db, mock_repo):
-    no_user = MagicMock()
+    no_user = MagicMock(spec=Result)
     no_user.scalar_one_or_none.return_value = None
     mock_db.execute.return_value = no_user
     mock_repo.create.return_value = make_invite()
@@ -82,9 +74,9 @@ async def test_create_defaults_team_id_to_none(service, mock_db, mock_repo):
 async def test_create_rejects_unknown_team(service, mock_db, mock_repo):
     from app.exceptions import NotFoundError
 
-    no_user = MagicMock()
+    no_user = MagicMock(spec=Result)
     no_user.scalar_one_or_none.return_value = None
-    no_team = MagicMock()
+    no_team = MagicMock(spec=Result)
     no_team.scalar_one_or_none.return_value = None
     # 1st execute: email-availability check; 2nd: TeamRepository.get lookup.
     mock_db.execute.side_effect = [no_user, no_team]
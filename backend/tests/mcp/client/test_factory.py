@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -7,41 +8,54 @@ from app.mcp.servers.models import MCPAuthType
 
 
 def _config(auth_type, id="s1", url="https://mcp.example.com"):
-    c = MagicMock()
-    c.auth_type = auth_type
-    c.id = id
-    c.url = url
-    return c
+    return SimpleNamespace(auth_type=auth_type, id=id, url=url)
 
 
-@pytest.mark.asyncio
-async def test_no_auth():
+@pytest.fixture(scope="module", autouse=True)
+def _oauth_patches(module_mocker):
+    """Patch the OAuth metadata builder and provider once for the module."""
+    metadata = module_mocker.patch(
+        "app.mcp.client.factory.build_oauth_client_metadata",
+        return_value={"client_id": "abc"},
+    )
+    provider = module_mocker.patch("app.mcp.client.factory.WebOAuthClientProvider")
+    return metadata, provider
+
+
+@pytest.fixture
+def oauth_mocks(_oauth_patches):
+    """The module's ``(metadata, provider)`` patches with call history cleared."""
+    for mock in _oauth_patches:
+        mock.reset_mock()
+    return _oauth_patches
+
+
+@pytest.mark.parametrize(
+    ("auth_type", "expected_headers"),
+    [
+        pytest.param(MCPAuthType.none, None, id="no_auth"),
+        pytest.param(
+            MCPAuthType.api_key, {"Authorization": "Bearer secret"}, id="api_key"
+        ),
+    ],
+)
+async def test_static_auth(mocker, auth_type, expected_headers):
+    mock_repo_cls = mocker.patch("app.mcp.client.factory.MCPServerRepository")
+    mock_repo_cls.return_value.get_api_key = AsyncMock(return_value="secret")
+
     factory = MCPClientConfigFactory(db=MagicMock(), user_id="u1")
-    result = await factory.build(_config(MCPAuthType.none))
+    result = await factory.build(_config(auth_type))
+
     assert result["transport"] == "http"
     assert result["url"] == "https://mcp.example.com"
+    assert result.get("headers") == expected_headers
 
 
-@pytest.mark.asyncio
-async def test_api_key_auth():
-    with patch("app.mcp.client.factory.MCPServerRepository") as mock_repo_cls:
-        repo = MagicMock()
-        repo.get_api_key = AsyncMock(return_value="secret")
-        mock_repo_cls.return_value = repo
-
-        factory = MCPClientConfigFactory(db=MagicMock(), user_id="u1")
-        result = await factory.build(_config(MCPAuthType.api_key))
-        assert result["headers"] == {"Authorization": "Bearer secret"}
-
-
-@pytest.mark.asyncio
-@patch("app.mcp.client.factory.WebOAuthClientProvider")
-@patch(
-    "app.mcp.client.factory.build_oauth_client_metadata",
-    return_value={"client_id": "abc"},
-)
-@patch("app.mcp.client.factory.TokenStorageFactory")
-async def test_oauth_auth(mock_storage_factory_cls, mock_metadata, mock_provider):
+async def test_oauth_auth(mocker, oauth_mocks):
+    mock_storage_factory_cls = mocker.patch(
+        "app.mcp.client.factory.TokenStorageFactory"
+    )
+    mock_metadata, mock_provider = oauth_mocks
     storage = MagicMock()
     mock_storage_factory_cls.return_value.get_storage.return_value = storage
 
@@ -57,21 +71,15 @@ async def test_oauth_auth(mock_storage_factory_cls, mock_metadata, mock_provider
     )
 
 
-@pytest.mark.asyncio
-@patch("app.mcp.client.factory.WebOAuthClientProvider")
-@patch(
-    "app.mcp.client.factory.build_oauth_client_metadata",
-    return_value={"client_id": "abc"},
-)
-@patch("app.mcp.client.factory.TokenStorageFactory")
-async def test_oauth_passes_server_id_as_str(
-    mock_storage_factory_cls, _mock_metadata, _mock_provider
-):
+async def test_oauth_passes_server_id_as_str(mocker):
     # Regression: config.id is a UUID; get_storage wants a str (pydantic v2
     # rejects UUID for OAuthStateData.mcp_server_id). The old test used id="s1"
     # (already a str) so it couldn't catch this.
     from uuid import uuid4
 
+    mock_storage_factory_cls = mocker.patch(
+        "app.mcp.client.factory.TokenStorageFactory"
+    )
     get_storage = mock_storage_factory_cls.return_value.get_storage
     sid = uuid4()
 
@@ -81,7 +89,6 @@ async def test_oauth_passes_server_id_as_str(
     get_storage.assert_called_once_with("u1", str(sid))
 
 
-@pytest.mark.asyncio
 async def test_unsupported_auth_type_raises():
     factory = MCPClientConfigFactory(db=MagicMock(), user_id="u1")
     with pytest.raises(ValueError, match="Unsupported auth type"):
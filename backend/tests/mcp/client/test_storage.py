@@ -1,6 +1,5 @@
 from datetime import UTC, datetime
 
-import pytest
 from mcp.shared.auth import OAuthToken
 
 from app.mcp.client.storage import RedisTokenStorage
@@ -23,7 +22,6 @@ def _storage() -> RedisTokenStorage:
     return RedisTokenStorage("u1", "s1", redis=_FakeRedis())
 
 
-@pytest.mark.asyncio
 async def test_refresh_without_refresh_token_preserves_stored_one():
     """Google omits refresh_token on refresh; the stored one must survive."""
     storage = _storage()
@@ -40,7 +38,6 @@ async def test_refresh_without_refresh_token_preserves_stored_one():
     assert tokens.refresh_token == "RT1"
 
 
-@pytest.mark.asyncio
 async def test_set_tokens_keeps_a_newly_issued_refresh_token():
     """A genuinely new refresh_token must not be shadowed by the old one."""
     storage = _storage()
@@ -57,7 +54,6 @@ async def test_set_tokens_keeps_a_newly_issued_refresh_token():
     assert tokens.refresh_token == "RT2"
 
 
-@pytest.mark.asyncio
 async def test_set_tokens_without_existing_token_stores_as_is():
     """No prior token + no incoming refresh_token: store as-is, no crash."""
     storage = _storage()
@@ -69,7 +65,6 @@ async def test_set_tokens_without_existing_token_stores_as_is():
     assert tokens.refresh_token is None
 
 
-@pytest.mark.asyncio
 async def test_set_tokens_updates_expiry_on_refresh():
     """expires_at must track the refresh response's expires_in, not the old value."""
     storage = _storage()
@@ -112,16 +112,6 @@ async def test_persist_client_info_noop_without_credentials():
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def mock_db():
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.commit = AsyncMock()
-    db.flush = AsyncMock()
-    db.execute = AsyncMock()
-    return db
-
-
 @pytest.fixture
 def mock_repo():
     repo = MagicMock()
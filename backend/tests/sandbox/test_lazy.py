@@ -61,7 +61,6 @@ def test_disconnected_file_ops_return_error_results():
     assert backend.grep("needle").error == NOT_CONNECTED_MSG
 
 
-@pytest.mark.asyncio
 async def test_disconnected_awrite_returns_error_result():
     """The eviction path calls the async variant; it inherits the guard via
     BackendProtocol's asyncio.to_thread delegation to the sync method."""
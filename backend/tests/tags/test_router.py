@@ -3,13 +3,14 @@ from unittest.mock import MagicMock
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
+from sqlalchemy.engine import Result, ScalarResult
 
 from app.tags.models import TagDB
 
 
 def test_create_tag_as_admin(client: TestClient, mock_db, admin_user):
     """Admin can create a tag."""
-    name_lookup = MagicMock()
+    name_lookup = MagicMock(spec=Result)
     name_lookup.scalar_one_or_none.return_value = None  # name available
     mock_db.execute.return_value = name_lookup
 
@@ -18,7 +19,7 @@ def test_create_tag_as_admin(client: TestClient, mock_db, admin_user):
         obj.created_at = datetime.now()
         obj.updated_at = datetime.now()
 
-    mock_db.refresh = mock_refresh
+    mock_db.refresh.side_effect = mock_refresh
 
     response = client.post("/tags/", json={"name": "Data"})
 
@@ -35,7 +36,7 @@ def test_create_tag_duplicate_name(client: TestClient, mock_db, admin_user):
         created_at=datetime.now(),
         updated_at=datetime.now(),
     )
-    name_lookup = MagicMock()
+    name_lookup = MagicMock(spec=Result)
     name_lookup.scalar_one_or_none.return_value = existing
     mock_db.execute.return_value = name_lookup
 
@@ -64,8 +65,8 @@ def test_list_tags(client: TestClient, mock_db, current_user):
         created_at=datetime.now(),
         updated_at=datetime.now(),
     )
-    result = MagicMock()
-    scalars = MagicMock()
+    result = MagicMock(spec=Result)
+    scalars = MagicMock(spec=ScalarResult)
     scalars.all.return_value = [tag1, tag2]
     result.scalars.return_value = scalars
     mock_db.execute.return_value = result
@@ -83,7 +84,7 @@ def test_delete_tag_as_admin(client: TestClient, mock_db, admin_user):
         created_at=datetime.now(),
         updated_at=datetime.now(),
     )
-    result = MagicMock()
+    result = MagicMock(spec=Result)
     result.scalar_one_or_none.return_value = tag
     mock_db.execute.return_value = result
 
@@ -14,18 +14,6 @@ from app.tags.schemas import TagCreate, TagPatch
 from app.tags.service import TagService
 
 
-@pytest.fixture
-def mock_db():
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.commit = AsyncMock()
-    db.refresh = AsyncMock()
-    db.delete = AsyncMock()
-    db.execute = AsyncMock()
-    db.flush = AsyncMock()
-    return db
-
-
 @pytest.fixture
 def mock_repo():
     repo = MagicMock()
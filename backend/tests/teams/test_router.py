@@ -3,13 +3,14 @@ from unittest.mock import MagicMock
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
+from sqlalchemy.engine import Result
 
 from app.teams.models import TeamDB
 
 
 def test_create_team_as_admin(client: TestClient, mock_db, admin_user):
     """Admin can create a team."""
-    name_lookup = MagicMock()
+    name_lookup = MagicMock(spec=Result)
     name_lookup.scalar_one_or_none.return_value = None  # name available
     mock_db.execute.return_value = name_lookup
 
@@ -18,7 +19,7 @@ def test_create_team_as_admin(client: TestClient, mock_db, admin_user):
         obj.created_at = datetime.now()
         obj.updated_at = datetime.now()
 
-    mock_db.refresh = mock_refresh
+    mock_db.refresh.side_effect = mock_refresh
 
     response = client.post("/teams/", json={"name": "Marketing", "color": "#6C5CE7"})
 
@@ -42,7 +43,7 @@ def test_create_team_duplicate_name(client: TestClient, mock_db, admin_user):
         created_at=datetime.now(),
         updated_at=datetime.now(),
     )
-    name_lookup = MagicMock()
+    name_lookup = MagicMock(spec=Result)
     name_lookup.scalar_one_or_none.return_value = existing
     mock_db.execute.return_value = name_lookup
 
@@ -73,7 +74,7 @@ def test_list_teams(client: TestClient, mock_db, current_user):
         created_at=datetime.now(),
         updated_at=datetime.now(),
     )
-    result = MagicMock()
+    result = MagicMock(spec=Result)
     result.all.return_value = [(team1, 3), (team2, 0)]
     mock_db.execute.return_value = result
 
@@ -94,7 +95,7 @@ def test_delete_team_as_admin(client: TestClient, mock_db, admin_user):
         created_at=datetime.now(),
         updated_at=datetime.now(),
     )
-    result = MagicMock()
+    result = MagicMock(spec=Result)
     result.scalar_one_or_none.return_value = team
     mock_db.execute.return_value = result
 
@@ -14,18 +14,6 @@ from app.teams.schemas import TeamCreate, TeamPatch
 from app.teams.service import TeamService
 
 
-@pytest.fixture
-def mock_db():
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.commit = AsyncMock()
-    db.refresh = AsyncMock()
-    db.delete = AsyncMock()
-    db.execute = AsyncMock()
-    db.flush = AsyncMock()
-    return db
-
-
 @pytest.fixture
 def mock_repo():
     repo = MagicMock()
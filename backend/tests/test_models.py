@@ -0,0 +1,99 @@
+"""Tests for the AI SDK message schemas' tagged ``MessagePart`` union."""
+
+import time
+import uuid
+import warnings
+from collections import OrderedDict
+
+import pytest
+from pydantic import ValidationError
+
+from app.models import (
+    FileMessagePart,
+    Message,
+    ReasoningMessagePart,
+    TextMessagePart,
+    ToolMessagePart,
+    uuid7,
+)
+
+
+def test_raw_parts_dispatch_on_type():
+    message = Message(
+        id="1",
+        role="assistant",
+        parts=[
+            {"type": "text", "text": "hi"},
+            {"type": "reasoning", "text": "hmm"},
+            {"type": "tool-get_weather", "toolCallId": "c1", "state": "call"},
+            {"type": "file", "url": "https://example.com/a.png"},
+        ],
+    )
+
+    assert [type(p) for p in message.parts] == [
+        TextMessagePart,
+        ReasoningMessagePart,
+        ToolMessagePart,
+        FileMessagePart,
+    ]
+
+
+def test_dump_omits_internal_tag():
+    message = Message(
+        id="1",
+        role="assistant",
+        parts=[
+            TextMessagePart(text="hi"),
+            ToolMessagePart(type="tool-search", toolCallId="c1", state="call"),
+        ],
+    )
+
+    dumped = message.model_dump()
+
+    assert dumped["parts"][0] == {"type": "text", "text": "hi"}
+    assert all("kind" not in part for part in dumped["parts"])
+    assert dumped["parts"][1]["type"] == "tool-search"
+
+
+def test_dict_subclass_parts_are_tagged():
+    message = Message(
+        id="1",
+        role="assistant",
+        parts=[OrderedDict(type="tool-search", toolCallId="c1", state="call")],
+    )
+
+    assert isinstance(message.parts[0], ToolMessagePart)
+
+
+def test_unknown_part_type_is_rejected():
+    with pytest.raises(ValidationError):
+        Message(id="1", role="user", parts=[{"type": "bogus"}])
+
+
+def test_dump_emits_no_union_fallback_warnings():
+    message = Message(
+        id="1",
+        role="assistant",
+        parts=[
+            TextMessagePart(text="hi"),
+            ReasoningMessagePart(text="hmm"),
+            ToolMessagePart(type="tool-search", toolCallId="c1", state="call"),
+            FileMessagePart(url="https://example.com/a.png"),
+        ],
+    )
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        message.model_dump()
+        message.model_dump_json()
+
+
+def test_uuid7_is_versioned_and_time_ordered():
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first.version == 7
+    assert first.variant == uuid.RFC_4122
+    assert first < second
+    assert abs((first.int >> 80) - time.time_ns() // 1_000_000) < 1_000
@@ -0,0 +1,16 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def checkpointer_cm():
+    """Build the ``async with get_checkpointer()`` stub that yields ``saver``."""
+
+    def build(saver):
+        cm = MagicMock()
+        cm.__aenter__ = AsyncMock(return_value=saver)
+        cm.__aexit__ = AsyncMock(return_value=None)
+        return cm
+
+    return build
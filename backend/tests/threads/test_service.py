@@ -1,14 +1,14 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.threads.service import ThreadService
 
 
 def _make_service():
-    db = AsyncMock()
-    db.add = MagicMock()
-    db.delete = AsyncMock()
-    db.flush = AsyncMock()
+    db = MagicMock(spec=AsyncSession)
     svc = ThreadService(db)
     svc.repository = MagicMock()
     return svc, db
@@ -46,17 +46,44 @@ async def test_delete_rows_for_agent_noop_when_no_threads():
     db.flush.assert_not_called()
 
 
+# ---------------------------------------------------------------------------
+# delete
+# ---------------------------------------------------------------------------
+
+
+async def test_delete_removes_row_and_checkpoints(checkpointer_cm):
+    svc, db = _make_service()
+    svc.repository.delete_by_id = AsyncMock()
+    checkpointer = AsyncMock()
+    with patch("app.threads.service.get_checkpointer") as mock_cp:
+        mock_cp.return_value = checkpointer_cm(checkpointer)
+        await svc.delete("t1")
+
+    svc.repository.delete_by_id.assert_awaited_once_with("t1")
+    checkpointer.adelete_thread.assert_awaited_once_with(thread_id="t1")
+    db.delete.assert_not_called()
+
+
+async def test_delete_keeps_checkpoints_when_row_delete_fails():
+    svc, _ = _make_service()
+    svc.repository.delete_by_id = AsyncMock(side_effect=RuntimeError("db down"))
+    with patch("app.threads.service.get_checkpointer") as mock_cp:
+        with pytest.raises(RuntimeError):
+            await svc.delete("t1")
+
+    mock_cp.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # purge_checkpoints
 # ---------------------------------------------------------------------------
 
 
-async def test_purge_checkpoints_deletes_each_thread():
+async def test_purge_checkpoints_deletes_each_thread(checkpointer_cm):
     svc, _ = _make_service()
     checkpointer = AsyncMock()
     with patch("app.threads.service.get_checkpointer") as mock_cp:
-        mock_cp.return_value.__aenter__ = AsyncMock(return_value=checkpointer)
-        mock_cp.return_value.__aexit__ = AsyncMock(return_value=None)
+        mock_cp.return_value = checkpointer_cm(checkpointer)
         await svc.purge_checkpoints(["t1", "t2"])
 
     assert checkpointer.adelete_thread.await_count == 2
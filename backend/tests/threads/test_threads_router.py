@@ -1,29 +1,36 @@
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock, patch
-from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock
+from uuid import UUID
 
 import pytest
-from fastapi.testclient import TestClient
+from httpx import AsyncClient
 from langchain_core.messages import AIMessage, HumanMessage
 
 from app.agents.structured_output import STRUCTURED_OUTPUT_FLAG
 from app.threads.models import ThreadDB, ThreadSource
 
 
+_FIXED_NOW = datetime(2024, 1, 1)
+# Fixed ids: no test relies on them being unique across the run.
+_UID_AGENT = UUID(int=2)
+_UID_THREAD = UUID(int=3)
+_UID_OTHER_USER = UUID(int=4)
+_UID_FAKE = UUID(int=999)
+
+
 @pytest.fixture(autouse=True)
-def _model_available():
+def _model_available(mocker):
     """These tests cover the thread routes, not model availability — pin the
     server-computed `model_available` flag to True so they don't depend on
     the whitelist or provider env keys."""
-    with patch("app.threads.service.ModelService") as model_service_cls:
-        model_service_cls.return_value.is_available = AsyncMock(return_value=True)
-        yield
+    model_service_cls = mocker.patch("app.threads.service.ModelService")
+    model_service_cls.return_value.is_available = AsyncMock(return_value=True)
 
 
-def test_create_thread(client: TestClient, mock_db, current_user):
+async def test_create_thread(async_client: AsyncClient, mock_db, current_user):
     """Test creating a new thread."""
     user_id = current_user.id
-    agent_id = uuid4()
+    agent_id = _UID_AGENT
 
     thread_data = {
         "user_id": str(user_id),
@@ -33,13 +40,13 @@ def test_create_thread(client: TestClient, mock_db, current_user):
 
     # Mock refresh to populate the created thread with generated fields
     async def mock_refresh(obj):
-        obj.id = str(uuid4())
-        obj.created_at = datetime.now()
-        obj.updated_at = datetime.now()
+        obj.id = str(_UID_THREAD)
+        obj.created_at = _FIXED_NOW
+        obj.updated_at = _FIXED_NOW
 
-    mock_db.refresh = mock_refresh
+    mock_db.refresh.side_effect = mock_refresh
 
-    response = client.post("/threads/", json=thread_data)
+    response = await async_client.post("/threads/", json=thread_data)
 
     assert response.status_code == 200
     data = response.json()
@@ -49,16 +56,18 @@ def test_create_thread(client: TestClient, mock_db, current_user):
     assert "id" in data
     assert "created_at" in data
     assert "updated_at" in data
-    # TestClient defaults to no cookies/bearer, but get_current_user is
+    # The client sends no cookies/bearer, but get_current_user is
     # overridden, so detect_auth_method falls through to "bearer" and the
     # server tags the thread as API-created.
     assert data["source"] == ThreadSource.api.value
 
 
-def test_create_thread_without_first_message(client: TestClient, mock_db, current_user):
+async def test_create_thread_without_first_message(
+    async_client: AsyncClient, mock_db, current_user
+):
     """Test creating a thread without first_message_content."""
     user_id = current_user.id
-    agent_id = uuid4()
+    agent_id = _UID_AGENT
     thread_data = {
         "user_id": str(user_id),
         "agent_id": str(agent_id),
@@ -66,13 +75,13 @@ def test_create_thread_without_first_message(client: TestClient, mock_db, curren
 
     # Mock refresh to populate the created thread with generated fields
     async def mock_refresh(obj):
-        obj.id = str(uuid4())
-        obj.created_at = datetime.now()
-        obj.updated_at = datetime.now()
+        obj.id = str(_UID_THREAD)
+        obj.created_at = _FIXED_NOW
+        obj.updated_at = _FIXED_NOW
 
-    mock_db.refresh = mock_refresh
+    mock_db.refresh.side_effect = mock_refresh
 
-    response = client.post("/threads/", json=thread_data)
+    response = await async_client.post("/threads/", json=thread_data)
 
     assert response.status_code == 200
     data = response.json()
@@ -81,37 +90,30 @@ def test_create_thread_without_first_message(client: TestClient, mock_db, curren
     assert data["first_message_content"] is None
 
 
-def test_get_threads(client: TestClient, mock_db, current_user):
+async def test_get_threads(
+    async_client: AsyncClient, mock_db, thread_factory, db_result, current_user
+):
     """Test getting all threads."""
     user_id = current_user.id
-    agent_id = uuid4()
-    thread1 = ThreadDB(
-        id=str(uuid4()),
-        user_id=user_id,
-        agent_id=agent_id,
-        first_message_content="First thread",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    agent_id = _UID_AGENT
+    thread1 = thread_factory(
+        user_id=user_id, agent_id=agent_id, first_message_content="First thread"
     )
-    thread2 = ThreadDB(
-        id=str(uuid4()),
-        user_id=user_id,
-        agent_id=agent_id,
-        first_message_content="Second thread",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    thread2 = thread_factory(
+        user_id=user_id, agent_id=agent_id, first_message_content="Second thread"
     )
 
-    count_result = MagicMock()
-    count_result.scalar_one.return_value = 2
-    rows_result = MagicMock()
-    rows_result.all.return_value = [
-        (thread2, "Test Agent", "🤖", None, False),
-        (thread1, "Test Agent", "🤖", None, False),
+    mock_db.execute.side_effect = [
+        db_result(scalar_one=2),
+        db_result(
+            all_=(
+                (thread2, "Test Agent", "🤖", None, False),
+                (thread1, "Test Agent", "🤖", None, False),
+            )
+        ),
     ]
-    mock_db.execute.side_effect = [count_result, rows_result]
 
-    response = client.get("/threads/")
+    response = await async_client.get("/threads/")
     assert response.status_code == 200
     data = response.json()
     assert len(data["items"]) == 2
@@ -120,54 +122,60 @@ def test_get_threads(client: TestClient, mock_db, current_user):
     assert data["offset"] == 0
 
 
-def test_get_threads_echoes_page_params(client: TestClient, mock_db, current_user):
+async def test_get_threads_echoes_page_params(
+    async_client: AsyncClient, mock_db, db_result, current_user
+):
     """limit/offset are echoed in the envelope; total is the unpaginated count."""
-    count_result = MagicMock()
-    count_result.scalar_one.return_value = 42
-    rows_result = MagicMock()
-    rows_result.all.return_value = []
-    mock_db.execute.side_effect = [count_result, rows_result]
+    mock_db.execute.side_effect = [db_result(scalar_one=42), db_result(all_=())]
 
-    response = client.get("/threads/", params={"limit": 10, "offset": 20})
+    response = await async_client.get("/threads/", params={"limit": 10, "offset": 20})
     assert response.status_code == 200
     data = response.json()
     assert data == {"items": [], "total": 42, "limit": 10, "offset": 20}
 
 
 @pytest.mark.usefixtures("current_user")
-def test_get_threads_rejects_invalid_page_params(client: TestClient):
-    assert client.get("/threads/", params={"limit": 0}).status_code == 422
-    assert client.get("/threads/", params={"limit": 201}).status_code == 422
-    assert client.get("/threads/", params={"offset": -1}).status_code == 422
-
-
-@patch("app.threads.router.get_checkpointer")
-def test_get_thread(mock_checkpointer, client: TestClient, mock_db, current_user):
+async def test_get_threads_rejects_invalid_page_params(async_client: AsyncClient):
+    assert (await async_client.get("/threads/", params={"limit": 0})).status_code == 422
+    assert (
+        await async_client.get("/threads/", params={"limit": 201})
+    ).status_code == 422
+    assert (
+        await async_client.get("/threads/", params={"offset": -1})
+    ).status_code == 422
+
+
+async def test_get_thread(
+    mocker,
+    async_client: AsyncClient,
+    mock_db,
+    thread_factory,
+    db_result,
+    current_user,
+    checkpointer_cm,
+):
     """Owner can read their own thread."""
-    thread_id = str(uuid4())
-    agent_id = uuid4()
-    thread = ThreadDB(
+    thread_id = str(_UID_THREAD)
+    agent_id = _UID_AGENT
+    thread = thread_factory(
         id=thread_id,
         user_id=current_user.id,
         agent_id=agent_id,
         first_message_content="Test thread",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = thread
-    mock_result.one_or_none.return_value = (thread, "Test Agent", "🤖", None, False)
-    mock_db.execute.return_value = mock_result
+    mock_db.execute.return_value = db_result(
+        scalar=thread, one_or_none=(thread, "Test Agent", "🤖", None, False)
+    )
 
     mock_saver_instance = AsyncMock()
     mock_saver_instance.aget_tuple = AsyncMock(return_value=None)
-    mock_checkpointer.return_value.__aenter__ = AsyncMock(
-        return_value=mock_saver_instance
+    mocker.patch(
+        "app.threads.router.get_checkpointer",
+        return_value=checkpointer_cm(mock_saver_instance),
     )
-    mock_checkpointer.return_value.__aexit__ = AsyncMock(return_value=None)
 
-    response = client.get(f"/threads/{thread_id}")
+    response = await async_client.get(f"/threads/{thread_id}")
     assert response.status_code == 200
     data = response.json()
     assert "thread" in data
@@ -175,28 +183,29 @@ def test_get_thread(mock_checkpointer, client: TestClient, mock_db, current_user
     assert data["thread"]["id"] == thread_id
     assert data["messages"] == []
     assert data["viewer_role"] is None
-
-
-@patch("app.threads.router.get_checkpointer")
-def test_get_thread_hides_structured_output_artifacts(
-    mock_checkpointer, client: TestClient, mock_db, current_user
+    # One joined thread+agent lookup; no separate ownership SELECT.
+    assert mock_db.execute.await_count == 1
+
+
+async def test_get_thread_hides_structured_output_artifacts(
+    mocker,
+    async_client: AsyncClient,
+    mock_db,
+    thread_factory,
+    db_result,
+    current_user,
+    checkpointer_cm,
 ):
     """Formatting-turn messages are filtered out of both message payloads and
     the parsed object is exposed under values.structured_response instead."""
-    thread_id = str(uuid4())
-    thread = ThreadDB(
-        id=thread_id,
-        user_id=current_user.id,
-        agent_id=uuid4(),
-        first_message_content="Test thread",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    thread_id = str(_UID_THREAD)
+    thread = thread_factory(
+        id=thread_id, user_id=current_user.id, first_message_content="Test thread"
     )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = thread
-    mock_result.one_or_none.return_value = (thread, "Test Agent", "🤖", None, False)
-    mock_db.execute.return_value = mock_result
+    mock_db.execute.return_value = db_result(
+        scalar=thread, one_or_none=(thread, "Test Agent", "🤖", None, False)
+    )
 
     checkpoint_tuple = MagicMock()
     checkpoint_tuple.checkpoint = {
@@ -215,12 +224,12 @@ def test_get_thread_hides_structured_output_artifacts(
     checkpoint_tuple.pending_writes = []
     mock_saver_instance = AsyncMock()
     mock_saver_instance.aget_tuple = AsyncMock(return_value=checkpoint_tuple)
-    mock_checkpointer.return_value.__aenter__ = AsyncMock(
-        return_value=mock_saver_instance
+    mocker.patch(
+        "app.threads.router.get_checkpointer",
+        return_value=checkpointer_cm(mock_saver_instance),
     )
-    mock_checkpointer.return_value.__aexit__ = AsyncMock(return_value=None)
 
-    response = client.get(f"/threads/{thread_id}")
+    response = await async_client.get(f"/threads/{thread_id}")
     assert response.status_code == 200
     data = response.json()
 
@@ -231,69 +240,80 @@ def test_get_thread_hides_structured_output_artifacts(
 
 
 @pytest.mark.usefixtures("current_user")
-def test_get_thread_forbidden_for_non_owner(client: TestClient, mock_db):
+async def test_get_thread_forbidden_for_non_owner(
+    mocker,
+    async_client: AsyncClient,
+    mock_db,
+    thread_factory,
+    db_result,
+):
     """A non-owner without admin access gets a 403."""
-    thread_id = str(uuid4())
-    agent_id = uuid4()
-    other_user_id = uuid4()
-    thread = ThreadDB(
+    thread_id = str(_UID_THREAD)
+    agent_id = _UID_AGENT
+    other_user_id = _UID_OTHER_USER
+    thread = thread_factory(
         id=thread_id,
         user_id=other_user_id,
         agent_id=agent_id,
         first_message_content="Someone else's thread",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = thread
     # The agent permission lookup returns no rows for a regular member.
-    mock_result.all.return_value = []
-    mock_db.execute.return_value = mock_result
+    mock_db.execute.return_value = db_result(
+        scalar=thread,
+        one_or_none=(thread, "Test Agent", "🤖", None, False),
+        all_=(),
+    )
+
+    get_checkpointer = mocker.patch("app.threads.router.get_checkpointer")
 
-    response = client.get(f"/threads/{thread_id}")
+    response = await async_client.get(f"/threads/{thread_id}")
     assert response.status_code in (403, 404)
+    assert "messages" not in response.json()
+    # Access is denied before any graph state is loaded.
+    get_checkpointer.assert_not_called()
 
 
 @pytest.mark.usefixtures("current_user")
-def test_get_thread_not_found(client: TestClient, mock_db):
+async def test_get_thread_not_found(
+    mocker, async_client: AsyncClient, mock_db, db_result
+):
     """Test getting a non-existent thread returns 404."""
-    fake_id = uuid4()
+    fake_id = _UID_FAKE
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_result.one_or_none.return_value = None
-    mock_db.execute.return_value = mock_result
+    mock_db.execute.return_value = db_result(scalar=None, one_or_none=None)
+    get_checkpointer = mocker.patch("app.threads.router.get_checkpointer")
 
-    response = client.get(f"/threads/{fake_id}")
+    response = await async_client.get(f"/threads/{fake_id}")
     assert response.status_code == 404
-    assert response.json()["detail"] == "Thread not found"
+    assert response.content == b'{"detail":"Thread not found"}'
+    get_checkpointer.assert_not_called()
 
 
-def test_update_thread(client: TestClient, mock_db, current_user):
+async def test_update_thread(
+    async_client: AsyncClient, mock_db, thread_factory, db_result, current_user
+):
     """Owner can rename their own thread (updates first_message_content only)."""
-    thread_id = str(uuid4())
-    agent_id = uuid4()
-    thread = ThreadDB(
+    thread_id = str(_UID_THREAD)
+    agent_id = _UID_AGENT
+    thread = thread_factory(
         id=thread_id,
         user_id=current_user.id,
         agent_id=agent_id,
         first_message_content="Old title",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = thread
-    mock_result.one_or_none.return_value = (thread, "Test Agent", "🤖", None, False)
-    mock_db.execute.return_value = mock_result
+    mock_db.get.return_value = thread
+    mock_db.execute.return_value = db_result(
+        one_or_none=(thread, "Test Agent", "🤖", None, False)
+    )
 
     async def mock_refresh(obj):
         pass
 
-    mock_db.refresh = mock_refresh
+    mock_db.refresh.side_effect = mock_refresh
 
-    response = client.patch(
+    response = await async_client.patch(
         f"/threads/{thread_id}", json={"first_message_content": "New title"}
     )
     assert response.status_code == 200
@@ -302,30 +322,29 @@ def test_update_thread(client: TestClient, mock_db, current_user):
     assert thread.first_message_content == "New title"
 
 
-def test_update_thread_ignores_model_id(client: TestClient, mock_db, current_user):
+async def test_update_thread_ignores_model_id(
+    async_client: AsyncClient, mock_db, thread_factory, db_result, current_user
+):
     """Rename is cosmetic: a `model_id` in the body must not mutate the thread."""
-    thread_id = str(uuid4())
-    thread = ThreadDB(
+    thread_id = str(_UID_THREAD)
+    thread = thread_factory(
         id=thread_id,
         user_id=current_user.id,
-        agent_id=uuid4(),
         model_id="claude-opus-4-8",
         first_message_content="Old title",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = thread
-    mock_result.one_or_none.return_value = (thread, "Test Agent", "🤖", None, False)
-    mock_db.execute.return_value = mock_result
+    mock_db.get.return_value = thread
+    mock_db.execute.return_value = db_result(
+        one_or_none=(thread, "Test Agent", "🤖", None, False)
+    )
 
     async def mock_refresh(obj):
         pass
 
-    mock_db.refresh = mock_refresh
+    mock_db.refresh.side_effect = mock_refresh
 
-    response = client.patch(
+    response = await async_client.patch(
         f"/threads/{thread_id}",
         json={"first_message_content": "New title", "model_id": "bogus-model"},
     )
@@ -335,93 +354,77 @@ def test_update_thread_ignores_model_id(client: TestClient, mock_db, current_use
 
 
 @pytest.mark.usefixtures("current_user")
-def test_update_thread_forbidden_for_non_owner(client: TestClient, mock_db):
+async def test_update_thread_forbidden_for_non_owner(
+    async_client: AsyncClient, mock_db, thread_factory
+):
     """A non-owner cannot rename a thread."""
-    thread_id = str(uuid4())
-    thread = ThreadDB(
+    thread_id = str(_UID_THREAD)
+    thread = thread_factory(
         id=thread_id,
-        user_id=uuid4(),
-        agent_id=uuid4(),
+        user_id=_UID_OTHER_USER,
         first_message_content="Someone else's thread",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = thread
-    mock_db.execute.return_value = mock_result
+    mock_db.get.return_value = thread
 
-    response = client.patch(
+    response = await async_client.patch(
         f"/threads/{thread_id}", json={"first_message_content": "Hijacked"}
     )
     assert response.status_code == 403
 
 
 @pytest.mark.usefixtures("current_user")
-def test_update_thread_not_found(client: TestClient, mock_db):
-    """Renaming a non-existent thread returns 404."""
-    fake_id = uuid4()
-
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_db.execute.return_value = mock_result
+@pytest.mark.parametrize(
+    ("method", "body"),
+    [
+        pytest.param("PATCH", {"first_message_content": "New title"}, id="update"),
+        pytest.param("DELETE", None, id="delete"),
+    ],
+)
+async def test_write_thread_not_found(async_client: AsyncClient, mock_db, method, body):
+    """Renaming or deleting a non-existent thread returns 404 before any write."""
+    mock_db.get.return_value = None
+
+    kwargs = {"json": body} if body is not None else {}
+    response = await async_client.request(method, f"/threads/{_UID_FAKE}", **kwargs)
 
-    response = client.patch(
-        f"/threads/{fake_id}", json={"first_message_content": "New title"}
-    )
     assert response.status_code == 404
-    assert response.json()["detail"] == "Thread not found"
+    assert response.content == b'{"detail":"Thread not found"}'
 
 
-@patch("app.threads.router.get_checkpointer")
-def test_delete_thread(mock_checkpointer, client: TestClient, mock_db, current_user):
+async def test_delete_thread(
+    mocker,
+    async_client: AsyncClient,
+    mock_db,
+    thread_factory,
+    current_user,
+    checkpointer_cm,
+):
     """Test deleting a thread."""
-    thread_id = str(uuid4())
-    agent_id = uuid4()
-    thread = ThreadDB(
+    thread_id = str(_UID_THREAD)
+    agent_id = _UID_AGENT
+    thread = thread_factory(
         id=thread_id,
         user_id=current_user.id,
         agent_id=agent_id,
         first_message_content="Thread to delete",
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
     )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = thread
-    mock_db.execute.return_value = mock_result
+    mock_db.get.return_value = thread
 
     # Mock the checkpointer context manager
     mock_saver_instance = AsyncMock()
     mock_saver_instance.adelete_thread = AsyncMock()
-    mock_checkpointer.return_value.__aenter__ = AsyncMock(
-        return_value=mock_saver_instance
+    mocker.patch(
+        "app.threads.service.get_checkpointer",
+        return_value=checkpointer_cm(mock_saver_instance),
     )
-    mock_checkpointer.return_value.__aexit__ = AsyncMock(return_value=None)
 
-    response = client.delete(f"/threads/{thread_id}")
+    response = await async_client.delete(f"/threads/{thread_id}")
     assert response.status_code == 204
-    mock_db.delete.assert_called_once()
-
-
-@pytest.mark.usefixtures("current_user")
-@patch("app.threads.router.get_checkpointer")
-def test_delete_thread_not_found(mock_checkpointer, client: TestClient, mock_db):
-    """Test deleting a non-existent thread returns 404."""
-    fake_id = uuid4()
-
-    # Mock the checkpointer context manager
-    mock_saver_instance = AsyncMock()
-    mock_saver_instance.adelete_thread = AsyncMock()
-    mock_checkpointer.return_value.__aenter__ = AsyncMock(
-        return_value=mock_saver_instance
-    )
-    mock_checkpointer.return_value.__aexit__ = AsyncMock(return_value=None)
-
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_db.execute.return_value = mock_result
-
-    response = client.delete(f"/threads/{fake_id}")
-    assert response.status_code == 404
-    assert response.json()["detail"] == "Thread not found"
+    # Ownership lookup via the identity map, then one bulk DELETE.
+    mock_db.get.assert_awaited_once_with(ThreadDB, thread_id)
+    assert mock_db.execute.await_count == 1
+    assert str(mock_db.execute.await_args[0][0]).startswith("DELETE FROM threads")
+    mock_db.delete.assert_not_called()
+    mock_saver_instance.adelete_thread.assert_awaited_once_with(thread_id=thread_id)
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
+from sqlalchemy.engine import Result
 
 from app.threads.models import ThreadDB, ThreadSource
 from app.triggers.models import TriggerDB
@@ -39,9 +40,9 @@ def _fire_thread(trigger: TriggerDB) -> ThreadDB:
 
 def _mock_execute_results(mock_db, trigger: TriggerDB | None, threads: list[ThreadDB]):
     """First execute: trigger lookup; second: the trigger's thread list."""
-    trigger_result = MagicMock()
+    trigger_result = MagicMock(spec=Result)
     trigger_result.scalar_one_or_none.return_value = trigger
-    threads_result = MagicMock()
+    threads_result = MagicMock(spec=Result)
     threads_result.scalars.return_value.all.return_value = threads
     mock_db.execute.side_effect = [trigger_result, threads_result]
 
@@ -0,0 +1,155 @@
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.exc import IntegrityError, InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import selectinload, sessionmaker
+from sqlmodel import SQLModel, select
+
+from app.exceptions import AlreadyExistsError, NotFoundError
+from app.teams.models import TeamDB
+from app.users.models import OAuthAccountDB, UserDB
+from app.users.schemas import UserPatch, UserTeamPatch
+from app.users.service import UserService
+
+
+@pytest.fixture
+async def db_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'users.db'}")
+
+    def _create(conn):
+        SQLModel.metadata.create_all(
+            conn,
+            tables=[TeamDB.__table__, UserDB.__table__, OAuthAccountDB.__table__],
+        )
+
+    async with engine.begin() as conn:
+        await conn.run_sync(_create)
+    yield sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def _add_user_with_account(db_factory) -> UserDB:
+    user = UserDB(id=uuid4(), name="Ada", email="ada@example.com")
+    async with db_factory() as db:
+        db.add(user)
+        db.add(OAuthAccountDB(provider="google", sub_id="123", user_id=user.id))
+        await db.commit()
+    return user
+
+
+async def test_get_is_a_single_query_and_never_lazy_loads_accounts(db_factory):
+    user = await _add_user_with_account(db_factory)
+    statements: list[str] = []
+
+    async with db_factory() as db:
+        event.listen(
+            db.bind.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        fetched = await UserService(db).get(user.id)
+
+        assert len(statements) == 1
+        with pytest.raises(InvalidRequestError, match="lazy='raise'"):
+            fetched.oauth_accounts  # noqa: B018
+
+
+async def test_oauth_accounts_load_eagerly_with_selectinload(db_factory):
+    user = await _add_user_with_account(db_factory)
+
+    async with db_factory() as db:
+        stmt = (
+            select(UserDB)
+            .where(UserDB.id == user.id)
+            .options(selectinload(UserDB.oauth_accounts))
+        )
+        fetched = (await db.execute(stmt)).scalar_one()
+
+    assert [a.sub_id for a in fetched.oauth_accounts] == ["123"]
+
+
+async def test_get_by_email_ignores_case(db_factory):
+    user = await _add_user_with_account(db_factory)
+
+    async with db_factory() as db:
+        fetched = await UserService(db).get_by_email("Ada@Example.COM")
+
+    assert fetched.id == user.id
+
+
+async def test_email_is_unique_ignoring_case(db_factory):
+    await _add_user_with_account(db_factory)
+
+    async with db_factory() as db:
+        db.add(UserDB(name="Ada again", email="ADA@example.com"))
+        with pytest.raises(IntegrityError):
+            await db.commit()
+
+
+async def test_update_email_is_a_single_statement(db_factory):
+    user = await _add_user_with_account(db_factory)
+    statements: list[str] = []
+
+    async with db_factory() as db:
+        event.listen(
+            db.bind.sync_engine,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: statements.append(statement),
+        )
+        updated = await UserService(db).update(
+            user.id, UserPatch(email="ada@new.example.com")
+        )
+
+    assert updated.email == "ada@new.example.com"
+    assert len(statements) == 1
+
+
+async def test_update_email_keeps_own_email_in_other_case(db_factory):
+    user = await _add_user_with_account(db_factory)
+
+    async with db_factory() as db:
+        updated = await UserService(db).update(
+            user.id, UserPatch(email="ADA@example.com")
+        )
+
+    assert updated.email == "ADA@example.com"
+
+
+async def test_update_email_rejects_email_taken_ignoring_case(db_factory):
+    await _add_user_with_account(db_factory)
+    other = UserDB(id=uuid4(), name="Bob", email="bob@example.com")
+    async with db_factory() as db:
+        db.add(other)
+        await db.commit()
+
+    async with db_factory() as db:
+        with pytest.raises(AlreadyExistsError):
+            await UserService(db).update(other.id, UserPatch(email="Ada@Example.com"))
+
+
+async def test_update_email_unknown_user_is_not_found(db_factory):
+    async with db_factory() as db:
+        with pytest.raises(NotFoundError):
+            await UserService(db).update(uuid4(), UserPatch(email="x@example.com"))
+
+
+async def test_update_team_empty_patch_keeps_team(db_factory):
+    team = TeamDB(id=uuid4(), name="Marketing")
+    user = UserDB(id=uuid4(), name="Ada", email="ada@example.com", team_id=team.id)
+    async with db_factory() as db:
+        db.add(team)
+        db.add(user)
+        await db.commit()
+
+    async with db_factory() as db:
+        updated = await UserService(db).update_team(user.id, UserTeamPatch())
+
+    assert updated.team_id == team.id
+
+
+async def test_update_team_unknown_user_wins_over_unknown_team(db_factory):
+    async with db_factory() as db:
+        with pytest.raises(NotFoundError, match="User not found"):
+            await UserService(db).update_team(uuid4(), UserTeamPatch(team_id=uuid4()))
@@ -1,422 +1,358 @@
 from datetime import datetime
-from unittest.mock import MagicMock
-from uuid import uuid4
+from uuid import UUID
 
-from fastapi.testclient import TestClient
+import pytest
+from httpx import AsyncClient
+from pydantic import TypeAdapter
 
+from app.pagination import Page
 from app.teams.models import TeamDB
-from app.users.models import UserDB, WorkspaceRole
-
-
-def test_create_user(client: TestClient, mock_db, admin_user):
+from app.users.models import WorkspaceRole
+from app.users.schemas import UserResponse
+
+
+_FIXED_NOW = datetime(2024, 1, 1)
+# Fixed ids: no test relies on them being unique across the run.
+_UID_USER = UUID(int=1)
+_UID_TEAM = UUID(int=2)
+_UID_FAKE = UUID(int=999)
+# Built once: validating a body checks its whole shape, not just the keys a
+# test happens to read.
+_UserRead = TypeAdapter(UserResponse)
+_UserPage = TypeAdapter(Page[UserResponse])
+# Read-only; tests that need a variant spread it into a new dict.
+_BASE_USER_PAYLOAD = {
+    "name": "Test User",
+    "email": "test@example.com",
+    "password_hash": "hashed_password",
+    "role": "member",
+}
+
+
+async def test_create_user(
+    async_client: AsyncClient, mock_db, user_factory, admin_user
+):
     """Test creating a new user (admin only)."""
-    user_data = {
-        "name": "Test User",
-        "email": "test@example.com",
-        "password_hash": "hashed_password",
-        "role": "member",
-    }
-
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_db.execute.return_value = mock_result
+    user_data = _BASE_USER_PAYLOAD
 
-    async def mock_refresh(obj):
-        obj.id = uuid4()
-        obj.created_at = datetime.now()
-        obj.updated_at = datetime.now()
+    # The row as returned by INSERT ... ON CONFLICT DO NOTHING RETURNING.
+    mock_db.scalar.return_value = user_factory(**user_data)
 
-    mock_db.refresh = mock_refresh
-
-    response = client.post("/users/", json=user_data)
+    response = await async_client.post("/users/", json=user_data)
 
     assert response.status_code == 201
-    data = response.json()
-    assert data["name"] == user_data["name"]
-    assert data["email"] == user_data["email"]
-    assert data["role"] == user_data["role"]
-    assert "id" in data
-    assert "created_at" in data
-    assert "updated_at" in data
-
-
-def test_create_user_duplicate_email(client: TestClient, mock_db, admin_user):
+    # No existence check before the insert: the unique index arbitrates.
+    assert mock_db.scalar.await_count == 1
+    assert str(mock_db.scalar.await_args[0][0]).startswith("INSERT INTO users")
+    user = _UserRead.validate_json(response.content)
+    assert user.name == user_data["name"]
+    assert user.email == user_data["email"]
+    assert user.role == user_data["role"]
+
+
+async def test_create_user_duplicate_email(
+    async_client: AsyncClient, mock_db, admin_user
+):
     """Test creating a user with duplicate email fails."""
-    user_data = {
-        "name": "Test User",
-        "email": "duplicate@example.com",
-        "password_hash": "hashed_password",
-    }
+    user_data = {**_BASE_USER_PAYLOAD, "email": "duplicate@example.com"}
 
-    existing_user = UserDB(
-        id=uuid4(),
-        name="Existing User",
-        email=user_data["email"],
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = existing_user
-    mock_db.execute.return_value = mock_result
+    # ON CONFLICT DO NOTHING: the insert returns no row.
+    mock_db.scalar.return_value = None
 
-    response = client.post("/users/", json=user_data)
+    response = await async_client.post("/users/", json=user_data)
     assert response.status_code == 409
-    assert response.json()["detail"] == "Email already registered"
+    assert response.content == b'{"detail":"Email already registered"}'
 
 
-def test_get_users(client: TestClient, mock_db, current_user):
+async def test_get_users(
+    async_client: AsyncClient, mock_db, user_factory, db_result, current_user
+):
     """Test getting all users (requires authentication)."""
-    user1 = UserDB(
-        id=uuid4(),
-        name="User 1",
-        email="user1@example.com",
-        role=WorkspaceRole.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
-    user2 = UserDB(
-        id=uuid4(),
-        name="User 2",
-        email="user2@example.com",
-        role=WorkspaceRole.admin,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    user1 = user_factory(name="User 1", email="user1@example.com")
+    user2 = user_factory(
+        name="User 2", email="user2@example.com", role=WorkspaceRole.admin
     )
 
-    count_result = MagicMock()
-    count_result.scalar_one.return_value = 2
-    rows_result = MagicMock()
-    rows_result.scalars.return_value.all.return_value = [user1, user2]
-    mock_db.execute.side_effect = [count_result, rows_result]
+    mock_db.execute.side_effect = [
+        db_result(scalar_one=2),
+        db_result(scalars_all=(user1, user2)),
+    ]
 
-    response = client.get("/users/")
+    response = await async_client.get("/users/")
     assert response.status_code == 200
-    data = response.json()
-    assert len(data["items"]) == 2
-    assert data["total"] == 2
-    assert data["limit"] == 50
-    assert data["offset"] == 0
+    page = _UserPage.validate_json(response.content)
+    assert len(page.items) == 2
+    assert page.total == 2
+    assert page.limit == 50
+    assert page.offset == 0
 
 
-def test_get_users_echoes_page_params(client: TestClient, mock_db, current_user):
+async def test_get_users_echoes_page_params(
+    async_client: AsyncClient, mock_db, db_result, current_user
+):
     """limit/offset are echoed in the envelope; total is the unpaginated count."""
-    count_result = MagicMock()
-    count_result.scalar_one.return_value = 7
-    rows_result = MagicMock()
-    rows_result.scalars.return_value.all.return_value = []
-    mock_db.execute.side_effect = [count_result, rows_result]
+    mock_db.execute.side_effect = [db_result(scalar_one=7), db_result(scalars_all=())]
 
-    response = client.get("/users/", params={"limit": 5, "offset": 5, "search": "ali"})
+    response = await async_client.get(
+        "/users/", params={"limit": 5, "offset": 5, "search": "ali"}
+    )
     assert response.status_code == 200
     assert response.json() == {"items": [], "total": 7, "limit": 5, "offset": 5}
 
 
-def test_count_users_by_role(client: TestClient, mock_db, current_user):
+async def test_count_users_by_role(
+    async_client: AsyncClient, mock_db, db_result, current_user
+):
     """Role counts are aggregated into the UserRoleCounts shape."""
-    mock_result = MagicMock()
-    mock_result.all.return_value = [
-        (WorkspaceRole.member, 3),
-        (WorkspaceRole.admin, 1),
-    ]
-    mock_db.execute.return_value = mock_result
+    mock_db.execute.return_value = db_result(
+        all_=((WorkspaceRole.member, 3), (WorkspaceRole.admin, 1))
+    )
 
-    response = client.get("/users/role-counts")
+    response = await async_client.get("/users/role-counts")
     assert response.status_code == 200
     assert response.json() == {"total": 4, "member": 3, "editor": 0, "admin": 1}
 
 
-def test_get_user(client: TestClient, mock_db, current_user):
+async def test_get_user(async_client: AsyncClient, mock_db, user_factory, current_user):
     """Test getting a single user by ID."""
-    user_id = uuid4()
-    user = UserDB(
-        id=user_id,
-        name="Test User",
-        email="getuser@example.com",
-        role=WorkspaceRole.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
+    user_id = _UID_USER
+    user = user_factory(id=user_id, name="Test User", email="getuser@example.com")
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_db.execute.return_value = mock_result
+    mock_db.get.return_value = user
 
-    response = client.get(f"/users/{user_id}")
+    response = await async_client.get(f"/users/{user_id}")
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == str(user_id)
-    assert data["email"] == user.email
-
-
-def test_get_user_not_found(client: TestClient, mock_db, current_user):
-    """Test getting a non-existent user returns 404."""
-    fake_id = uuid4()
-
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_db.execute.return_value = mock_result
+    data = _UserRead.validate_json(response.content)
+    assert data.id == user_id
+    assert data.email == user.email
+
+
+@pytest.mark.parametrize(
+    ("method", "path", "body"),
+    [
+        pytest.param("get", "/users/{id}", None, id="get"),
+        pytest.param(
+            "get", "/users/email/nonexistent@example.com", None, id="by_email"
+        ),
+        pytest.param("patch", "/users/{id}", {"name": "Updated Name"}, id="update"),
+        pytest.param("patch", "/users/{id}/role", {"role": "admin"}, id="update_role"),
+        pytest.param("delete", "/users/{id}", None, id="delete"),
+    ],
+)
+async def test_user_not_found(
+    async_client: AsyncClient, mock_db, admin_user, method, path, body
+):
+    """Every single-user route returns 404 for an unknown user."""
+    # Lookups go through get() by id and scalar() for email/UPDATE/DELETE.
+    mock_db.get.return_value = None
+    mock_db.scalar.return_value = None
+
+    kwargs = {"json": body} if body is not None else {}
+    response = await async_client.request(
+        method.upper(), path.format(id=_UID_FAKE), **kwargs
+    )
 
-    response = client.get(f"/users/{fake_id}")
     assert response.status_code == 404
-    assert response.json()["detail"] == "User not found"
+    assert response.content == b'{"detail":"User not found"}'
 
 
-def test_get_user_by_email(client: TestClient, mock_db, current_user):
+async def test_get_user_by_email(
+    async_client: AsyncClient, mock_db, user_factory, current_user
+):
     """Test getting a user by email."""
-    user = UserDB(
-        id=uuid4(),
-        name="Test User",
-        email="byemail@example.com",
-        role=WorkspaceRole.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
+    user = user_factory(name="Test User", email="byemail@example.com")
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_db.execute.return_value = mock_result
+    mock_db.scalar.return_value = user
 
-    response = client.get(f"/users/email/{user.email}")
+    response = await async_client.get(f"/users/email/{user.email}")
     assert response.status_code == 200
-    data = response.json()
-    assert data["email"] == user.email
-    assert data["name"] == user.name
-
+    data = _UserRead.validate_json(response.content)
+    assert data.email == user.email
+    assert data.name == user.name
 
-def test_get_user_by_email_not_found(client: TestClient, mock_db, current_user):
-    """Test getting a non-existent user by email returns 404."""
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_db.execute.return_value = mock_result
-
-    response = client.get("/users/email/nonexistent@example.com")
-    assert response.status_code == 404
-    assert response.json()["detail"] == "User not found"
 
-
-def test_update_user(client: TestClient, mock_db, admin_user):
+async def test_update_user(
+    async_client: AsyncClient, mock_db, user_factory, admin_user
+):
     """Test updating a user (admin only)."""
-    user_id = uuid4()
-    user = UserDB(
-        id=user_id,
-        name="Original Name",
-        email="original@example.com",
-        role=WorkspaceRole.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    user_id = _UID_USER
+    updated = user_factory(
+        id=user_id, name="Updated Name", email="original@example.com"
     )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_db.execute.return_value = mock_result
+    # The row as returned by UPDATE ... RETURNING.
+    mock_db.scalar.return_value = updated
 
     update_data = {
         "name": "Updated Name",
     }
 
-    response = client.patch(f"/users/{user_id}", json=update_data)
+    response = await async_client.patch(f"/users/{user_id}", json=update_data)
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == str(user_id)
-    assert data["name"] == update_data["name"]
+    data = _UserRead.validate_json(response.content)
+    assert data.id == user_id
+    assert data.name == update_data["name"]
+    # No read before the write: a single UPDATE ... RETURNING.
+    assert mock_db.scalar.await_count == 1
+    assert str(mock_db.scalar.await_args[0][0]).startswith("UPDATE users")
 
 
-def test_update_user_role(client: TestClient, mock_db, admin_user):
+async def test_update_user_role(
+    async_client: AsyncClient, mock_db, user_factory, admin_user
+):
     """Test updating a user's role (admin only)."""
-    user_id = uuid4()
-    user = UserDB(
-        id=user_id,
-        name="Test User",
-        email="test@example.com",
-        role=WorkspaceRole.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    user_id = _UID_USER
+    updated = user_factory(
+        id=user_id, name="Test User", email="test@example.com", role=WorkspaceRole.admin
     )
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_db.execute.return_value = mock_result
+    # The row as returned by UPDATE ... RETURNING.
+    mock_db.scalar.return_value = updated
 
-    response = client.patch(f"/users/{user_id}/role", json={"role": "admin"})
+    response = await async_client.patch(
+        f"/users/{user_id}/role", json={"role": "admin"}
+    )
     assert response.status_code == 200
-    data = response.json()
-    assert data["id"] == str(user_id)
-    assert data["role"] == "admin"
-
-
-def test_update_user_role_not_found(client: TestClient, mock_db, admin_user):
-    """Test updating role of a non-existent user returns 404."""
-    fake_id = uuid4()
-
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_db.execute.return_value = mock_result
-
-    response = client.patch(f"/users/{fake_id}/role", json={"role": "admin"})
-    assert response.status_code == 404
-    assert response.json()["detail"] == "User not found"
+    assert mock_db.scalar.await_count == 1
+    data = _UserRead.validate_json(response.content)
+    assert data.id == user_id
+    assert data.role == WorkspaceRole.admin
 
 
-def test_update_user_duplicate_email(client: TestClient, mock_db, admin_user):
+async def test_update_user_duplicate_email(
+    async_client: AsyncClient, mock_db, user_factory, admin_user
+):
     """Test updating a user with an email that already exists fails."""
-    user_id = uuid4()
-    user = UserDB(
-        id=user_id,
-        name="User 2",
-        email="user2@example.com",
-        role=WorkspaceRole.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
-
-    existing_user = UserDB(
-        id=uuid4(),
-        name="User 1",
-        email="user1@example.com",
-        role=WorkspaceRole.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
+    user_id = _UID_USER
+    target = user_factory(id=user_id, name="User 2", email="user2@example.com")
 
-    # First call returns the user to update, second call returns existing user with target email
-    mock_result1 = MagicMock()
-    mock_result1.scalar_one_or_none.return_value = user
-    mock_result2 = MagicMock()
-    mock_result2.scalar_one_or_none.return_value = existing_user
-    mock_db.execute.side_effect = [mock_result1, mock_result2]
+    # The guarded UPDATE matches no row; the id lookup shows the user exists,
+    # so the email must be taken.
+    mock_db.scalar.return_value = None
+    mock_db.get.return_value = target
 
     update_data = {"email": "user1@example.com"}
-    response = client.patch(f"/users/{user_id}", json=update_data)
+    response = await async_client.patch(f"/users/{user_id}", json=update_data)
     assert response.status_code == 409
-    assert response.json()["detail"] == "Email already registered"
-
-
-def test_update_user_not_found(client: TestClient, mock_db, admin_user):
-    """Test updating a non-existent user returns 404."""
-    fake_id = uuid4()
-
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_db.execute.return_value = mock_result
-
-    update_data = {"name": "Updated Name"}
-    response = client.patch(f"/users/{fake_id}", json=update_data)
-    assert response.status_code == 404
-    assert response.json()["detail"] == "User not found"
+    assert response.content == b'{"detail":"Email already registered"}'
+    assert mock_db.scalar.await_count == 1
+    assert str(mock_db.scalar.await_args[0][0]).startswith("UPDATE users")
 
 
-def test_delete_user(client: TestClient, mock_db, admin_user):
+async def test_delete_user(async_client: AsyncClient, mock_db, admin_user):
     """Test deleting a user."""
-    user_id = uuid4()
-    user = UserDB(
-        id=user_id,
-        name="Test User",
-        email="delete@example.com",
-        role=WorkspaceRole.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
-    )
+    user_id = _UID_USER
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = user
-    mock_db.execute.return_value = mock_result
+    # DELETE ... RETURNING id hands back the deleted row's id.
+    mock_db.scalar.return_value = user_id
 
-    response = client.delete(f"/users/{user_id}")
+    response = await async_client.delete(f"/users/{user_id}")
     assert response.status_code == 204
-    mock_db.delete.assert_called_once()
-
+    assert mock_db.scalar.await_count == 1
+    assert str(mock_db.scalar.await_args[0][0]).startswith("DELETE FROM users")
+    mock_db.delete.assert_not_called()
 
-def test_delete_user_not_found(client: TestClient, mock_db, admin_user):
-    """Test deleting a non-existent user returns 404."""
-    fake_id = uuid4()
 
-    mock_result = MagicMock()
-    mock_result.scalar_one_or_none.return_value = None
-    mock_db.execute.return_value = mock_result
-
-    response = client.delete(f"/users/{fake_id}")
-    assert response.status_code == 404
-    assert response.json()["detail"] == "User not found"
-
-
-def test_update_user_team(client: TestClient, mock_db, admin_user):
+async def test_update_user_team(
+    async_client: AsyncClient, mock_db, user_factory, db_result, admin_user
+):
     """Admin can assign a user to an existing team."""
-    user_id = uuid4()
-    team_id = uuid4()
-    user = UserDB(
-        id=user_id,
-        name="Test User",
-        email="teamuser@example.com",
-        role=WorkspaceRole.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    user_id = _UID_USER
+    team_id = _UID_TEAM
+    updated = user_factory(
+        id=user_id, name="Test User", email="teamuser@example.com", team_id=team_id
     )
     team = TeamDB(
         id=team_id,
         name="Marketing",
         color=None,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+        created_at=_FIXED_NOW,
+        updated_at=_FIXED_NOW,
     )
 
-    user_result = MagicMock()
-    user_result.scalar_one_or_none.return_value = user
-    team_result = MagicMock()
-    team_result.scalar_one_or_none.return_value = team
-    mock_db.execute.side_effect = [user_result, team_result]
+    # Team lookup, then the UPDATE ... RETURNING.
+    mock_db.execute.return_value = db_result(scalar=team)
+    mock_db.scalar.return_value = updated
 
-    response = client.patch(f"/users/{user_id}/team", json={"team_id": str(team_id)})
+    response = await async_client.patch(
+        f"/users/{user_id}/team", json={"team_id": str(team_id)}
+    )
 
     assert response.status_code == 200
-    assert response.json()["team_id"] == str(team_id)
+    assert _UserRead.validate_json(response.content).team_id == team_id
 
 
-def test_update_user_team_unassign(client: TestClient, mock_db, admin_user):
+async def test_update_user_team_unassign(
+    async_client: AsyncClient, mock_db, user_factory, admin_user
+):
     """Passing a null team_id clears the user's team."""
-    user_id = uuid4()
-    user = UserDB(
-        id=user_id,
-        name="Test User",
-        email="teamuser@example.com",
-        role=WorkspaceRole.member,
-        team_id=uuid4(),
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    user_id = _UID_USER
+    updated = user_factory(
+        id=user_id, name="Test User", email="teamuser@example.com", team_id=None
     )
-    user_result = MagicMock()
-    user_result.scalar_one_or_none.return_value = user
-    mock_db.execute.return_value = user_result
+    # No team to look up: straight to the UPDATE ... RETURNING.
+    mock_db.scalar.return_value = updated
 
-    response = client.patch(f"/users/{user_id}/team", json={"team_id": None})
+    response = await async_client.patch(
+        f"/users/{user_id}/team", json={"team_id": None}
+    )
 
     assert response.status_code == 200
-    assert response.json()["team_id"] is None
+    assert _UserRead.validate_json(response.content).team_id is None
 
 
-def test_update_user_team_team_not_found(client: TestClient, mock_db, admin_user):
+async def test_update_user_team_team_not_found(
+    async_client: AsyncClient, mock_db, user_factory, db_result, admin_user
+):
     """Assigning a non-existent team returns 404."""
-    user_id = uuid4()
-    user = UserDB(
-        id=user_id,
-        name="Test User",
-        email="teamuser@example.com",
-        role=WorkspaceRole.member,
-        created_at=datetime.now(),
-        updated_at=datetime.now(),
+    user_id = _UID_USER
+    mock_db.execute.return_value = db_result(scalar=None)
+    mock_db.get.return_value = user_factory(id=user_id, name="U", email="u@x.com")
+
+    response = await async_client.patch(
+        f"/users/{user_id}/team", json={"team_id": str(_UID_FAKE)}
     )
-    user_result = MagicMock()
-    user_result.scalar_one_or_none.return_value = user
-    team_result = MagicMock()
-    team_result.scalar_one_or_none.return_value = None
-    mock_db.execute.side_effect = [user_result, team_result]
 
-    response = client.patch(f"/users/{user_id}/team", json={"team_id": str(uuid4())})
+    assert response.status_code == 404
+    assert response.content == b'{"detail":"Team not found"}'
+    mock_db.scalar.assert_not_called()
+
+
+async def test_update_user_team_unknown_user_and_team(
+    async_client: AsyncClient, mock_db, db_result, admin_user
+):
+    """An unknown user is reported before an unknown team."""
+    mock_db.execute.return_value = db_result(scalar=None)
+    mock_db.get.return_value = None
+
+    response = await async_client.patch(
+        f"/users/{_UID_FAKE}/team", json={"team_id": str(_UID_TEAM)}
+    )
 
     assert response.status_code == 404
-    assert response.json()["detail"] == "Team not found"
+    assert response.content == b'{"detail":"User not found"}'
 
 
-def test_update_user_team_requires_admin(client: TestClient, mock_db):
+async def test_update_user_team_empty_body_keeps_team(
+    async_client: AsyncClient, mock_db, user_factory, admin_user
+):
+    """An empty body changes nothing, so the user keeps their team."""
+    user_id = _UID_USER
+    mock_db.get.return_value = user_factory(
+        id=user_id, name="Test User", email="teamuser@example.com", team_id=_UID_TEAM
+    )
+
+    response = await async_client.patch(f"/users/{user_id}/team", json={})
+
+    assert response.status_code == 200
+    assert _UserRead.validate_json(response.content).team_id == _UID_TEAM
+    mock_db.scalar.assert_not_called()
+    mock_db.execute.assert_not_called()
+
+
+async def test_update_user_team_requires_admin(async_client: AsyncClient, mock_db):
     """The team endpoint is admin-gated."""
-    response = client.patch(f"/users/{uuid4()}/team", json={"team_id": None})
+    response = await async_client.patch(
+        f"/users/{_UID_FAKE}/team", json={"team_id": None}
+    )
     assert response.status_code in (401, 403)